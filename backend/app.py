@@ -1,46 +1,120 @@
 import os
 import uuid
-import glob
 import re
+import asyncio
+import copy
+import base64
+from datetime import datetime, timedelta, timezone
 from schemas import *
-from fastapi import FastAPI, Request, BackgroundTasks
-from fastapi.responses import JSONResponse, FileResponse
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request, Depends
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy import create_engine, delete, and_
-from sqlalchemy.engine import URL
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import delete, and_, or_, select, update, text, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
+from database import engine, Session, get_session
+from migrations import migrate
 import json
-from resume import generate_latex
+from resume import generate_latex, render_pool, TEMPLATE_VERSION
+from pdf_cache import PDFCache, document_key
+from preview import render_preview
+from zip_stream import stream_zip, safe_entry_name
+from render_pool import RenderQueueFull, RenderTimeout
+from llm_cache import CompletionCache, completion_key
+from singleflight import SingleFlight, claim_lease, claim_or_wait
+from postings import normalize_job_url, load_posting, is_fresh, claim_refresh, release_refresh, save_posting, touch_posting
+from fetcher import PageFetcher, FetchError
+from extract import JobPageExtractor
 from typing import Dict
 from pydantic import BaseModel
-from openai import OpenAI
-import requests
-from fpdf import FPDF
-import tiktoken
+from llm import create_provider
+import pdf_fonts
+import tokenizer
 
 from dotenv import load_dotenv
 load_dotenv()
 
-openai_client = OpenAI(
-    api_key=os.getenv("OPENAI_API_KEY"),
+llm_provider = create_provider()
+page_fetcher = PageFetcher(
+    connect_timeout=float(os.getenv("FETCH_CONNECT_TIMEOUT", "5")),
+    read_timeout=float(os.getenv("FETCH_READ_TIMEOUT", "15")),
+    total_timeout=float(os.getenv("FETCH_TOTAL_TIMEOUT", "30")),
+    max_bytes=int(os.getenv("FETCH_MAX_BYTES", str(5 * 1024 * 1024))),
+    max_redirects=int(os.getenv("FETCH_MAX_REDIRECTS", "5")),
+    max_connections=int(os.getenv("FETCH_MAX_CONNECTIONS", "50")),
 )
 
-app = FastAPI()
+# Upper bound on in-flight LLM calls for the whole process, and the default
+# fan-out used by a single tailoring request.
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "16"))
+TAILOR_MAX_CONCURRENCY = int(os.getenv("TAILOR_MAX_CONCURRENCY", "8"))
+llm_semaphore = asyncio.Semaphore(LLM_MAX_CONCURRENCY)
 
-Base = declarative_base()
-DATABASE_URL = URL.create(
-    drivername=os.getenv("PSQL_DRIVERNAME"),
-    username=os.getenv("PSQL_USERNAME"),
-    password=os.getenv("PSQL_PASSWORD"),
-    host=os.getenv("PSQL_HOST"),
-    port=os.getenv("PSQL_PORT"),
-    database=os.getenv("PSQL_DATABASE")
+# Token budget for the job page text sent to each fetch-description prompt.
+JOB_PAGE_MAX_TOKENS = 100_000
+
+# How long a shared job posting is reused before it is fetched and summarised again.
+POSTING_TTL = int(os.getenv("POSTING_TTL", str(24 * 3600)))
+# How long one worker may spend refreshing a posting, or generating a LeetCode description,
+# before another worker may take the work over.
+POSTING_REFRESH_LEASE = int(os.getenv("POSTING_REFRESH_LEASE", "120"))
+LEETCODE_LEASE = int(os.getenv("LEETCODE_LEASE", "120"))
+
+completion_cache = CompletionCache(
+    Session,
+    max_entries=int(os.getenv("LLM_CACHE_MAX_ENTRIES", "1024")),
+    memory_ttl=int(os.getenv("LLM_CACHE_MEMORY_TTL", "3600")),
+    db_ttl=int(os.getenv("LLM_CACHE_DB_TTL", str(30 * 24 * 3600))),
+)
+
+# Identical requests already in flight in this process share one upstream call.
+flights = SingleFlight()
+
+pdf_cache = PDFCache(
+    os.getenv("PDF_CACHE_DIR", os.path.dirname(os.path.realpath(__file__)) + "/pdf-cache"),
+    max_disk_bytes=int(os.getenv("PDF_CACHE_MAX_BYTES", str(512 * 1024 * 1024))),
+    memory_entries=int(os.getenv("PDF_CACHE_MEMORY_ENTRIES", "256")),
+    memory_bytes=int(os.getenv("PDF_CACHE_MEMORY_BYTES", str(64 * 1024 * 1024))),
 )
-engine = create_engine(DATABASE_URL, echo=True)
 
-Session = sessionmaker(bind=engine)
-session = Session()
+async def complete(endpoint, model, messages, max_tokens=None):
+    """Run a chat completion through the completion cache and return the message text."""
+    key = completion_key(model, messages, max_tokens)
+    cached = await completion_cache.get(endpoint, key)
+    if cached is not None:
+        return cached
+    return await flights.do(f"completion:{key}", lambda: run_completion(key, model, messages, max_tokens))
+
+async def run_completion(key, model, messages, max_tokens):
+    async with llm_semaphore:
+        response = await llm_provider.complete(model, messages, max_tokens)
+    if response:
+        try:
+            await completion_cache.set(key, model, response)
+        except Exception as e:
+            # The completion is already paid for: a failed cache write must not fail the request.
+            print(f"Could not cache completion {key}: {e}")
+    return response
+
+async def warm_tokenizer():
+    """Load the tokenizer before the first request; if that fails, it loads on first use instead."""
+    try:
+        await asyncio.to_thread(tokenizer.get_encoding)
+    except Exception as e:
+        print(f"Could not load the tokenizer at startup, will retry on first use: {e}")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await migrate(engine)
+    await warm_tokenizer()
+    yield
+    await page_fetcher.aclose()
+    await llm_provider.aclose()
+    await engine.dispose()
+
+app = FastAPI(lifespan=lifespan)
 
 origins = ["*"]
 app.add_middleware(
@@ -50,17 +124,49 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-def to_dict(model):
-    """Convert SQLAlchemy model instance to dictionary, ignoring internal attributes."""
-    return {column.name: getattr(model, column.name) for column in model.__table__.columns  if column.name not in ["uid", "unique_id"]}
+@app.exception_handler(RenderQueueFull)
+async def render_queue_full(request: Request, exc: RenderQueueFull):
+    return JSONResponse(
+        content={"Error": "Too many documents are being rendered right now, please retry shortly"},
+        status_code=503,
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
+@app.exception_handler(RenderTimeout)
+async def render_timeout(request: Request, exc: RenderTimeout):
+    return JSONResponse(content={"Error": str(exc)}, status_code=504)
 
 @app.get("/")
 def root():
     return JSONResponse(content={"Message" : "Hello, World!"}, status_code=200)
 
+@app.get("/metrics")
+def metrics():
+    return JSONResponse(content={"llm_cache": completion_cache.stats(), "render_pool": render_pool.stats(), "pdf_cache": pdf_cache.stats()}, status_code=200)
+
+async def bump_version(session, unique_id):
+    """Invalidate every ETag handed out for this user; call inside the transaction that writes."""
+    await session.execute(update(Login).where(Login.unique_id == unique_id).values(version=Login.version + 1))
+
+async def user_etag(session, unique_id):
+    version = await session.scalar(select(Login.version).where(Login.unique_id == unique_id))
+    return f'"{version}"' if version is not None else None
+
+def not_modified(request, etag):
+    """A 304 response if the client's If-None-Match already names `etag`, else None."""
+    if etag is None:
+        return None
+    tags = [tag.strip() for tag in request.headers.get("if-none-match", "").split(",")]
+    if etag in tags or "*" in tags:
+        return Response(status_code=304, headers={"ETag": etag})
+    return None
+
+def etag_headers(etag):
+    return {"ETag": etag} if etag else None
+
 @app.get("/login")
-def login(unique_id: str):
-    row = session.query(Login).filter(Login.unique_id == unique_id).first()
+async def login(unique_id: str, session: AsyncSession = Depends(get_session)):
+    row = await session.scalar(select(Login).where(Login.unique_id == unique_id))
     
     if row:
         return JSONResponse(content={
@@ -75,171 +181,279 @@ def login(unique_id: str):
 
 
 @app.post("/register")
-def register(unique_id: str, name: str):
-    row = session.query(Login).filter(Login.unique_id == unique_id).first()
+async def register(unique_id: str, name: str, session: AsyncSession = Depends(get_session)):
+    row = await session.scalar(select(Login).where(Login.unique_id == unique_id))
     if row:
         return JSONResponse(content={
             "Message": f"Hello {row.name}"
         }, status_code=200)
-    
-    else:
-        user = Login(unique_id, name)
-        session.add(user)
-        session.commit()
-        return JSONResponse(content={
-            "Message": "Successfully Registered!",
-            "name" : user.name
-        }, status_code=200)
+
+    user = Login(unique_id, name)
+    session.add(user)
+    await session.commit()
+    return JSONResponse(content={
+        "Message": "Successfully Registered!",
+        "name" : user.name
+    }, status_code=200)
 
 @app.post("/update-details")
-async def update_details(request: Request):
+async def update_details(request: Request, session: AsyncSession = Depends(get_session)):
     data = await request.json()
     unique_id = data['unique_id']
     content = data['content']
-    content['personal_details']['unique_id'] = unique_id
-    list_keys = ['education', 'work_experience', 'projects']
-    for key in list_keys:
-        for entry in content[key]:
-            entry['uid'] = str(uuid.uuid1().int)
-            entry['unique_id'] = unique_id
-    tmp = content['skills']
-    del content['skills']
-    content['skills'] = {'unique_id': unique_id, 'skills': tmp}
-    tables = {
-        "personal_details" : Personal_Details,
-        "education" : Education_Details,
-        "work_experience" : Work_Details,
-        "projects" : Project_Details,
-        "skills" : Skills
-              }
-    for table in tables.values():
-        stmt = delete(table).where(table.unique_id == unique_id)
-        session.execute(stmt)
-    session.commit()
-    for ck, cv in content.items():
-        if type(cv) == list:
-            for item in cv:
-                row =  tables[ck](**item)
-                session.add(row)
-        else:
-            row =  tables[ck](**cv)
-            session.add(row)
-    session.commit()
+    uids = {}
+    async with session.begin():
+        await upsert_profile_row(session, Personal_Details, {**content['personal_details'], 'unique_id': unique_id})
+        await upsert_profile_row(session, Skills, {'unique_id': unique_id, 'skills': content['skills']})
+        for key in PROFILE_ENTRY_TABLES:
+            uids[key] = await sync_profile_entries(session, PROFILE_TABLES[key], unique_id, content[key])
+        await bump_version(session, unique_id)
+    return JSONResponse(content={"Message": "Successfully Saved Details!", "uids": uids}, status_code=200)
+
+def entry_columns(table):
+    return [column.name for column in table.__table__.columns if column.name not in ["uid", "unique_id", "position"]]
+
+async def upsert_profile_row(session, table, values):
+    """Insert or update a one-per-user row, leaving it untouched when nothing changed."""
+    columns = entry_columns(table)
+    stmt = insert(table).values(unique_id=values['unique_id'], **{column: values.get(column) for column in columns})
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[table.unique_id],
+        set_={column: stmt.excluded[column] for column in columns},
+        where=or_(*[table.__table__.c[column].is_distinct_from(stmt.excluded[column]) for column in columns]),
+    )
+    await session.execute(stmt)
+
+async def sync_profile_entries(session, table, unique_id, entries):
+    """Write only new or edited entries and delete removed ones; returns the entry uids in order.
+
+    A uid the client sends is kept only if it is one of this user's stored entries.
+    """
+    fields = entry_columns(table)
+    columns = fields + ["position"]
+    stored = {row.uid: row for row in (await session.execute(select(table.__table__).where(table.unique_id == unique_id))).all()}
+    rows = []
+    for position, entry in enumerate(entries):
+        uid = entry.get('uid')
+        if uid not in stored or any(row['uid'] == uid for row in rows):
+            uid = str(uuid.uuid1().int)
+        rows.append({'uid': uid, 'unique_id': unique_id, 'position': position, **{field: entry.get(field) for field in fields}})
+
+    changed = [row for row in rows if row['uid'] not in stored
+               or any(getattr(stored[row['uid']], column) != row[column] for column in columns)]
+    if changed:
+        stmt = insert(table).values(changed)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.uid],
+            set_={column: stmt.excluded[column] for column in columns},
+            where=table.unique_id == unique_id,
+        )
+        await session.execute(stmt)
+
+    removed = stored.keys() - {row['uid'] for row in rows}
+    if removed:
+        await session.execute(delete(table).where(and_(table.unique_id == unique_id, table.uid.in_(removed))))
+    return [row['uid'] for row in rows]
 
 @app.get("/load-details")
-def load_details(unique_id: str):
-    tables = {
-        "personal_details" : Personal_Details,
-        "education" : Education_Details,
-        "work_experience" : Work_Details,
-        "projects" : Project_Details,
-        "skills" : Skills
-              }
-    data = {}
-    for tablek, tablev in tables.items():
-        if tablek in ["personal_details", "skills"]:
-            results = session.query(tablev).filter(tablev.unique_id == unique_id).first()
-            results_dict = to_dict(results) if results else None
+async def load_details(request: Request, unique_id: str, session: AsyncSession = Depends(get_session)):
+    # The version comes back with the profile, so even a 304 costs one round trip.
+    version, profile = await load_profile_json(session, unique_id)
+    etag = f'"{version}"' if version is not None else None
+    if cached := not_modified(request, etag):
+        return cached
+    return Response(content=profile, media_type="application/json", headers=etag_headers(etag))
+
+PROFILE_TABLES = {
+    "personal_details" : Personal_Details,
+    "education" : Education_Details,
+    "work_experience" : Work_Details,
+    "projects" : Project_Details,
+    "skills" : Skills
+}
+PROFILE_ENTRY_TABLES = ["education", "work_experience", "projects"]
+
+def build_profile_query():
+    """One statement that has Postgres assemble the whole profile as a JSON document, next to the user's version."""
+    fields = []
+    for key, table in PROFILE_TABLES.items():
+        if key in PROFILE_ENTRY_TABLES:
+            value = (f"COALESCE((SELECT jsonb_agg(to_jsonb(t) - 'unique_id' - 'position' ORDER BY t.position) "
+                     f"FROM {table.__tablename__} t WHERE t.unique_id = :unique_id), '[]'::jsonb)")
         else:
-            results = session.query(tablev).filter(tablev.unique_id == unique_id).all()
-            results_dict = [to_dict(result) for result in results]
-        data[tablek] = results_dict
-    return JSONResponse(content=data, status_code=200)
+            value = f"(SELECT to_jsonb(t) - 'unique_id' FROM {table.__tablename__} t WHERE t.unique_id = :unique_id)"
+        fields.append(f"'{key}', {value}")
+    return text(f"SELECT (SELECT version FROM {Login.__tablename__} WHERE unique_id = :unique_id), "
+                f"jsonb_build_object({', '.join(fields)})::text")
+
+PROFILE_QUERY = build_profile_query()
+
+async def load_profile_json(session, unique_id):
+    """The user's version (None for an unknown user) and their profile as JSON text."""
+    return (await session.execute(PROFILE_QUERY, {"unique_id": unique_id})).one()
+
+async def load_profile(session, unique_id):
+    _, profile = await load_profile_json(session, unique_id)
+    return json.loads(profile)
 
 class ResumeRequest(BaseModel):
     content: Dict
 
-def delete_files(directory: str, base_name: str):
-    pattern = os.path.join(directory, f"{base_name}.*")
-    files_to_delete = glob.glob(pattern)
+@app.post("/generate-resume")
+async def generate_resume(content: dict):
+    if content.get('preview'):
+        # Draft layout straight from fpdf; the pdflatex render is only for the final download.
+        pdf = await asyncio.to_thread(render_preview, content['data'])
+        return Response(content=pdf, media_type="application/pdf",
+                        headers={"Content-Disposition": 'inline; filename="resume_preview.pdf"'})
+    key, pdf = await resume_pdf(content['data'])
+    if pdf is None:
+        return JSONResponse(content={"Error": "Could not render resume"}, status_code=500)
+    return Response(content=pdf, media_type="application/pdf",
+                    headers={"Content-Disposition": f'attachment; filename="resume_{key[:16]}.pdf"'})
 
-    for file in files_to_delete:
-        try:
-            os.remove(file)
-            print(f"Deleted: {file}")
-        except Exception as e:
-            print(f"Error deleting {file}: {e}")
+async def resume_pdf(data):
+    """PDF bytes for `data` from the cache, or from one shared pdflatex render; returns (key, pdf)."""
+    key = document_key(data, TEMPLATE_VERSION)
+    pdf = await pdf_cache.get(key)
+    if pdf is None:
+        pdf = await flights.do(f"resume:{key}", lambda: render_resume(key, data))
+    return key, pdf
 
-@app.post("/generate-resume")
-async def generate_resume(content: dict, background_tasks: BackgroundTasks):
-    rand_uuid = str(uuid.uuid1().int)
-    directory = "resume/"
-    os.makedirs("resume/", exist_ok=True)
-    await generate_latex(content['data'], rand_uuid)
-    background_tasks.add_task(delete_files, directory, rand_uuid)
-    return FileResponse(path=directory + rand_uuid + ".pdf",
-                        filename=f"resume_{rand_uuid}.pdf",
-                        media_type="application/pdf")
+async def render_resume(key, data):
+    pdf = await generate_latex(data)
+    if pdf is not None:
+        await pdf_cache.set(key, pdf)
+    return pdf
 
 
 @app.post("/add-job")
-async def add_job(request:Request):
+async def add_job(request:Request, session: AsyncSession = Depends(get_session)):
     data = await request.json()
     unique_id = data['unique_id']
     job_name = data['job_name']
     job_uuid = str(uuid.uuid1().int)
-    job = UserJobs(job_uuid, unique_id, job_name)
-    session.add(job)
-    session.commit()
+    stmt = insert(UserJobs).values(job_id=job_uuid, unique_id=unique_id, job_name=job_name)
+    stmt = stmt.on_conflict_do_nothing(index_elements=[UserJobs.unique_id, UserJobs.job_name])
+    inserted = await session.scalar(stmt.returning(UserJobs.job_id))
+    if inserted is not None:
+        await bump_version(session, unique_id)
+    await session.commit()
+    if inserted is None:
+        return JSONResponse(content={"Error": "Job already exists"}, status_code=409)
     return JSONResponse(content={
         "Message": "Successfully Added Job!",
-        "Job" : f"{job.job_id} {job_name}"
+        "Job" : f"{job_uuid} {job_name}"
     }, status_code=200)
 
 @app.post("/remove-job")
-async def remove_job(request:Request):
+async def remove_job(request:Request, session: AsyncSession = Depends(get_session)):
     data = await request.json()
     unique_id = data['unique_id']
     job_name = data['job_name']
-    tab = session.query(UserJobs).filter(and_(
+    tab = await session.scalar(select(UserJobs).where(and_(
             UserJobs.job_name == job_name,
             UserJobs.unique_id == unique_id
-        )).first()
-    session.delete(tab)
-    tab = session.query(Jobs).filter(and_(
+        )))
+    await session.delete(tab)
+    tab = await session.scalar(select(Jobs).where(and_(
             Jobs.job_name == job_name,
             Jobs.unique_id == unique_id
-        )).first()
-    session.delete(tab)
-    session.commit()
+        )))
+    await session.delete(tab)
+    await bump_version(session, unique_id)
+    await session.commit()
     return JSONResponse(content={
         "Message": "Successfully Deleted Job!",
         "Job" : f"{job_name}"
     }, status_code=200)
 
 
+# sort name -> (column, newest first). job_id breaks ties so every page boundary is exact.
+JOB_SORTS = {
+    "name": (UserJobs.job_name, False),
+    "newest": (UserJobs.created_at, True),
+    "oldest": (UserJobs.created_at, False),
+}
+MAX_JOBS_PAGE = int(os.getenv("MAX_JOBS_PAGE", "200"))
+
+def encode_job_cursor(value, job_id):
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    return base64.urlsafe_b64encode(json.dumps([value, job_id]).encode()).decode()
+
+def decode_job_cursor(cursor, sort):
+    value, job_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    if JOB_SORTS[sort][0] is UserJobs.created_at:
+        value = datetime.fromisoformat(value)
+    return value, job_id
+
 @app.get("/load-jobs")
-def load_jobs(unique_id: str):
-    row = session.query(UserJobs.job_name).filter(UserJobs.unique_id == unique_id).all()
-    if not row:
-        return JSONResponse(content={"jobs" : []})
-    job_names = [job[0] for job in row]
-    print(job_names)
-    return JSONResponse(content={"jobs" : job_names})
+async def load_jobs(request: Request, unique_id: str, sort: str = "name", limit: int = None, after: str = None,
+                    session: AsyncSession = Depends(get_session)):
+    """A user's jobs ordered by `sort`; with `limit`, one keyset page continuing from the `after` cursor."""
+    if sort not in JOB_SORTS:
+        return JSONResponse(content={"Error": f"Unknown sort: {sort}"}, status_code=400)
+    etag = await user_etag(session, unique_id)
+    if cached := not_modified(request, etag):
+        return cached
+
+    column, descending = JOB_SORTS[sort]
+    stmt = select(UserJobs.job_name, UserJobs.job_id, column).where(UserJobs.unique_id == unique_id)
+    if after:
+        try:
+            position = tuple_(*decode_job_cursor(after, sort))
+        except (ValueError, TypeError):
+            return JSONResponse(content={"Error": "Invalid cursor"}, status_code=400)
+        keys = tuple_(column, UserJobs.job_id)
+        stmt = stmt.where(keys < position if descending else keys > position)
+    if descending:
+        stmt = stmt.order_by(column.desc(), UserJobs.job_id.desc())
+    else:
+        stmt = stmt.order_by(column, UserJobs.job_id)
+    if limit is not None:
+        limit = max(1, min(limit, MAX_JOBS_PAGE))
+        # One extra row tells whether another page follows.
+        stmt = stmt.limit(limit + 1)
 
-def get_job_uuid(unique_id, job_name):
-    row = session.query(UserJobs.job_id).filter(and_(
+    rows = (await session.execute(stmt)).all()
+    next_cursor = None
+    if limit is not None and len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_job_cursor(rows[-1][2], rows[-1][1])
+    return JSONResponse(content={
+        "jobs" : [job[0] for job in rows],
+        "job_ids" : [job[1] for job in rows],
+        "next_cursor": next_cursor
+    }, headers=etag_headers(etag))
+
+async def get_job_uuid(session, unique_id, job_name):
+    return await session.scalar(select(UserJobs.job_id).where(and_(
                 UserJobs.job_name == job_name,
                 UserJobs.unique_id == unique_id
-            )).first()
-    return row[0]
+            )))
 
 @app.get("/get-job-uuid")
-async def get_job_id(request: Request):
+async def get_job_id(request: Request, session: AsyncSession = Depends(get_session)):
     data = await request.json()
     unique_id = data['unique_id']
     job_name = data['job_name']
-    row = session.query(UserJobs.job_id).filter(and_(
-                UserJobs.job_name == job_name,
-                UserJobs.unique_id == unique_id
-            )).first()
-    return JSONResponse(content={"job_uuid" : row[0]})
+    job_uuid = await get_job_uuid(session, unique_id, job_name)
+    return JSONResponse(content={"job_uuid" : job_uuid})
 
-def truncate_to_200k_tokens(text, model="gpt-4o-mini"):
-    enc = tiktoken.encoding_for_model(model)
-    tokens = enc.encode(text)
-    truncated_tokens = tokens[:100_000]
-    return enc.decode(truncated_tokens)
+def prepare_posting_text(extractor, input_bytes):
+    """Finish extracting a job page's visible main text and JSON-LD JobPosting, then cut it to the token budget.
+
+    Only the extracted text is tokenized; the raw page (up to FETCH_MAX_BYTES) is reported in bytes.
+    """
+    extractor.close()
+    text = tokenizer.truncate(extractor.text(), JOB_PAGE_MAX_TOKENS)
+    stats = {
+        "input_bytes": input_bytes,
+        "output_bytes": len(text.encode("utf-8")),
+        "output_tokens": tokenizer.count_tokens(text),
+    }
+    return text, stats
 
 @app.post("/fetch-description")
 async def fetch_description(request: Request):
@@ -247,12 +461,74 @@ async def fetch_description(request: Request):
     unique_id = data['unique_id']
     job_name = data['job_name']
     job_url = data['job_url']
-    job_uuid = get_job_uuid(unique_id, job_name)
-    
-    headers = {"User-Agent": "Mozilla/5.0"}
-    response = requests.get(job_url, headers=headers)
-    content = response.text
-    completion1 = openai_client.chat.completions.create(
+    canonical_url = normalize_job_url(job_url)
+
+    async with Session() as session:
+        posting = await load_posting(session, canonical_url)
+    try:
+        if posting and is_fresh(posting, POSTING_TTL):
+            posting_id, desc, req = posting.posting_id, posting.job_desc, posting.job_req
+        else:
+            posting_id, desc, req = await flights.do(
+                f"posting:{canonical_url}", lambda: refresh_posting(job_url, canonical_url)
+            )
+    except FetchError as e:
+        if posting is None or posting.job_desc is None:
+            return JSONResponse(content={"Error": str(e)}, status_code=502)
+        # A stale summary beats none; the next request tries the refresh again.
+        print(f"Could not refresh posting {canonical_url}, serving the one fetched at {posting.fetched_at}: {e}")
+        posting_id, desc, req = posting.posting_id, posting.job_desc, posting.job_req
+
+    async with Session() as session:
+        job_uuid = await get_job_uuid(session, unique_id, job_name)
+        job = Jobs(job_uuid, unique_id, job_name, job_url, desc, req, posting_id)
+        session.add(job)
+        await bump_version(session, unique_id)
+        await session.commit()
+    return JSONResponse(content={
+        "Message": "Successfully Added Job!",
+        "description" : f"{desc}",
+        "requirements": f"{req}"
+    }, status_code=200)
+
+async def refresh_posting(job_url, canonical_url):
+    """Fetch (or revalidate) and summarise a stale posting; one worker at a time per URL."""
+    async def claim():
+        async with Session.begin() as session:
+            return await claim_refresh(session, canonical_url, POSTING_TTL, POSTING_REFRESH_LEASE)
+
+    async def load_fresh():
+        async with Session() as session:
+            posting = await load_posting(session, canonical_url)
+        return posting if posting and is_fresh(posting, POSTING_TTL) else None
+
+    posting, fresh = await claim_or_wait(claim, load_fresh)
+    if fresh is not None:
+        return fresh.posting_id, fresh.job_desc, fresh.job_req
+
+    try:
+        # The page is parsed as it streams in, so the raw HTML is never held in full.
+        extractor = JobPageExtractor()
+        page = await page_fetcher.fetch(job_url, etag=posting.etag, last_modified=posting.last_modified, sink=extractor)
+        if not page.not_modified:
+            desc, req = await summarise_posting(page, extractor)
+    except Exception:
+        async with Session.begin() as session:
+            await release_refresh(session, posting)
+        raise
+
+    async with Session.begin() as session:
+        if page.not_modified:
+            await touch_posting(session, posting)
+            return posting.posting_id, posting.job_desc, posting.job_req
+        posting_id = await save_posting(session, canonical_url, desc, req, page.etag, page.last_modified)
+    return posting_id, desc, req
+
+async def summarise_posting(page, extractor):
+    content, stats = await asyncio.to_thread(prepare_posting_text, extractor, page.size)
+    print(f"Extracted job page {page.url}: {stats}")
+    desc = await complete(
+        "fetch-description",
         model="gpt-4.1-nano-2025-04-14",
         messages=[
             {
@@ -261,13 +537,14 @@ async def fetch_description(request: Request):
             },
             {
                 "role": "user",
-                "content": truncate_to_200k_tokens(content)
+                "content": content
             }
         ],
         max_tokens=512,
     )
-    completion2 = openai_client.chat.completions.create(
-    model="gpt-4.1-nano-2025-04-14",
+    req = await complete(
+        "fetch-description",
+        model="gpt-4.1-nano-2025-04-14",
         messages=[
             {
                 "role": "developer",
@@ -277,106 +554,251 @@ async def fetch_description(request: Request):
             },
             {
                 "role": "user",
-                "content": truncate_to_200k_tokens(content)
+                "content": content
             }
         ],
         max_tokens=512,
     )
-
-    desc = completion1.choices[0].message.content
-    req = completion2.choices[0].message.content
-    
-    job = Jobs(job_uuid, unique_id, job_name, job_url, desc, req)
-    session.add(job)
-    session.commit()
-    return JSONResponse(content={
-        "Message": "Successfully Added Job!",
-        "description" : f"{desc}",
-        "requirements": f"{req}"
-    }, status_code=200)
+    return desc, req
 
 @app.get("/get-job-details")
-async def get_job_details(request: Request):
+async def get_job_details(request: Request, session: AsyncSession = Depends(get_session)):
     data = await request.json()
     unique_id = data['unique_id']
     job_name = data['job_name']
-    job_uuid = get_job_uuid(unique_id, job_name)
-    row = session.query(Jobs).filter(and_(
+    etag = await user_etag(session, unique_id)
+    if cached := not_modified(request, etag):
+        return cached
+    job_uuid = await get_job_uuid(session, unique_id, job_name)
+    row = await session.scalar(select(Jobs).where(and_(
                 Jobs.job_id == job_uuid,
                 Jobs.job_name == job_name,
                 Jobs.unique_id == unique_id
-            )).first()
+            )))
     if not row:
-        return JSONResponse(content={"job_url" : "", "description" : ""})
-    return JSONResponse(content={"job_url" : row.job_url, "description" : row.job_desc, "requirements": row.job_req})
+        return JSONResponse(content={"job_url" : "", "description" : ""}, headers=etag_headers(etag))
+    return JSONResponse(content={"job_url" : row.job_url, "description" : row.job_desc, "requirements": row.job_req},
+                        headers=etag_headers(etag))
 
 
-@app.post("/generate-tailored-resume")
-async def generate_tailored_resume(request: Request, background_tasks: BackgroundTasks):
-    data = await request.json()
-    content = data['data']
-    job_desc = data['job_desc']
-    fields = [['education', 'description'], ['work_experience', 'work_desc'], ['projects', 'project_desc']]
+TAILOR_FIELDS = [['education', 'description'], ['work_experience', 'work_desc'], ['projects', 'project_desc']]
+
+async def rewrite_section(section, job_desc, semaphore):
+    async with semaphore:
+        response = await complete(
+            "generate-tailored-resume",
+            model="gpt-4.1-nano-2025-04-14",
+            messages=[
+                {
+                    "role": "developer",
+                    "content" : f"""
+                    You are a Resume Bot that tailors the resume details according to a job description. You are given a job description and a particular section from the resume. 
+                    Rewrite the Resume section to suit it for a professional career resume. You should only return the relevant rewritten description as response without any extra words or notes.
+                    Each line in the rewritten description should be in separate lines without any bullets. Do not add any extra new lines in-between. Do not add any special characters in your response.
+                    Only rewrite the given lines of the Resume section. Do not add irrelevant information that is not present in the Resume Section."""
+                },
+                {
+                    "role": "user",
+                    "content": f"""
+                    Resume section: {section.encode('utf-8', 'ignore').decode('utf-8')}
+                    Job Description: {job_desc}"""
+                }
+            ],
+            max_tokens=512,
+        )
+
+    response = re.sub(r'\n+', '\n', response)
+    return response.rstrip("\n")
+
+async def tailor_resume_content(content, job_desc, semaphore):
+    """Rewrite every section entry concurrently under `semaphore`, keeping the original section order."""
+    entries = [(v, key) for field, key in TAILOR_FIELDS for v in content[field]]
+    responses = await asyncio.gather(*[rewrite_section(v[key], job_desc, semaphore) for v, key in entries])
+    for (v, key), response in zip(entries, responses):
+        v[key] = response
 
     new_json = {
         'personal_details' : content['personal_details']
     }
-    
-    for field, key in fields:
-        value = content[field]
-        new_json[field] = []
-        
-        for v in value:
-            completion = openai_client.chat.completions.create(
-                model="gpt-4.1-nano-2025-04-14",
-                messages=[
-                    {
-                        "role": "developer",
-                        "content" : f"""
-                        You are a Resume Bot that tailors the resume details according to a job description. You are given a job description and a particular section from the resume. 
-                        Rewrite the Resume section to suit it for a professional career resume. You should only return the relevant rewritten description as response without any extra words or notes.
-                        Each line in the rewritten description should be in separate lines without any bullets. Do not add any extra new lines in-between. Do not add any special characters in your response.
-                        Only rewrite the given lines of the Resume section. Do not add irrelevant information that is not present in the Resume Section."""
-                    },
-                    {
-                        "role": "user",
-                        "content": f"""
-                        Resume section: {v[key].encode('utf-8', 'ignore').decode('utf-8')}
-                        Job Description: {job_desc}"""
-                    }
-                ],
-                max_tokens=512,
-            )
-            
-            response = completion.choices[0].message.content
-            response = re.sub(r'\n+', '\n', response)
-            response = response.rstrip("\n")
-            v[key] = response
-            new_json[field].append(v)
-            
+    for field, _ in TAILOR_FIELDS:
+        new_json[field] = content[field]
     new_json['skills'] = content['skills']
+    return new_json
+
+@app.post("/generate-tailored-resume")
+async def generate_tailored_resume(request: Request):
+    data = await request.json()
+    content = data['data']
+    job_desc = data['job_desc']
+    max_concurrency = int(data.get('max_concurrency', TAILOR_MAX_CONCURRENCY))
+    semaphore = asyncio.Semaphore(max(1, min(max_concurrency, TAILOR_MAX_CONCURRENCY)))
+
+    new_json = await tailor_resume_content(content, job_desc, semaphore)
+
+    return await generate_resume({'data': new_json})
+
+# Batch tailoring jobs are rows in tailor_batch_jobs, so any worker can report on or zip a batch.
+# Rows are kept for TAILOR_BATCH_TTL; a job not finished within TAILOR_JOB_LEASE counts as failed.
+TAILOR_BATCH_TTL = int(os.getenv("TAILOR_BATCH_TTL", "3600"))
+TAILOR_JOB_LEASE = int(os.getenv("TAILOR_JOB_LEASE", "900"))
+TAILOR_ZIP_POLL_INTERVAL = 1.0
+
+@app.post("/tailor-resumes")
+async def tailor_resumes(request: Request):
+    """Tailor the user's resume for several saved jobs at once; progress and a ZIP of the results hang off the task id."""
+    data = await request.json()
+    unique_id = data['unique_id']
+    job_ids = data['job_ids']
+    task_id = str(uuid.uuid4())
+    now = datetime.now(timezone.utc)
+    async with Session.begin() as session:
+        profile = await load_profile(session, unique_id)
+        rows = (await session.execute(select(UserJobs.job_id, UserJobs.job_name).where(and_(
+                    UserJobs.unique_id == unique_id,
+                    UserJobs.job_id.in_(job_ids)
+                )))).all()
+        job_names = dict(rows)
+        if not job_names:
+            return JSONResponse(content={"Error": "No saved jobs to tailor"}, status_code=404)
+        descriptions = dict((await session.execute(select(Jobs.job_id, Jobs.job_desc).where(and_(
+                    Jobs.unique_id == unique_id,
+                    Jobs.job_id.in_(job_names)
+                )))).all())
+        await session.execute(delete(TailorBatchJobs).where(
+            TailorBatchJobs.created_at < now - timedelta(seconds=TAILOR_BATCH_TTL)))
+        jobs = [TailorBatchJobs(task_id, job_id, unique_id, job_name,
+                                "running" if descriptions.get(job_id) else "failed",
+                                now + timedelta(seconds=TAILOR_JOB_LEASE))
+                for job_id, job_name in job_names.items()]
+        session.add_all(jobs)
+
+    # Every rewrite of every job in the batch shares one limit (and llm_semaphore underneath).
+    semaphore = asyncio.Semaphore(TAILOR_MAX_CONCURRENCY)
+    for job_row in jobs:
+        if job_row.status == "running":
+            job = asyncio.create_task(tailor_batch_job(task_id, job_row.job_id, profile, descriptions[job_row.job_id], semaphore))
+            background_jobs.add(job)
+            job.add_done_callback(background_jobs.discard)
+    return JSONResponse(content={"task_id": task_id, "jobs": [batch_job_status(job, now) for job in jobs]}, status_code=202)
+
+async def tailor_batch_job(task_id, job_id, profile, job_desc, semaphore):
+    content = key = pdf = None
+    try:
+        content = await tailor_resume_content(copy.deepcopy(profile), job_desc, semaphore)
+        key, pdf = await render_batch_resume(content)
+    except Exception as e:
+        print(f"Tailoring job {job_id} failed: {e}")
+    async with Session.begin() as session:
+        await session.execute(update(TailorBatchJobs).where(and_(
+                TailorBatchJobs.task_id == task_id,
+                TailorBatchJobs.job_id == job_id
+            )).values(
+                status="done" if pdf else "failed",
+                resume=content if pdf else None,
+                pdf_key=key if pdf else None,
+                tailoring_until=None,
+            ))
+
+async def render_batch_resume(content):
+    while True:
+        try:
+            return await resume_pdf(content)
+        except RenderQueueFull as e:
+            # Batches are not interactive: wait for the render queue instead of failing the job.
+            await asyncio.sleep(e.retry_after)
+
+async def load_batch(task_id):
+    async with Session() as session:
+        return (await session.scalars(select(TailorBatchJobs)
+                                      .options(defer(TailorBatchJobs.resume))
+                                      .where(TailorBatchJobs.task_id == task_id)
+                                      .order_by(TailorBatchJobs.job_name, TailorBatchJobs.job_id))).all()
+
+async def load_batch_resume(task_id, job_id):
+    async with Session() as session:
+        return await session.scalar(select(TailorBatchJobs.resume).where(and_(
+                    TailorBatchJobs.task_id == task_id,
+                    TailorBatchJobs.job_id == job_id
+                )))
 
-    return await generate_resume({'data': new_json}, background_tasks)
+def batch_job_state(job, now):
+    if job.status == "running" and job.tailoring_until is not None and job.tailoring_until < now:
+        return "failed"
+    return job.status
 
-def create_pdf_from_string(text: str, filename: str):
-    pdf = FPDF()
-    pdf.add_font("NotoSans", style="", fname="./fonts/NotoSans-VariableFont_wdth,wght.ttf", uni=True)
+def batch_entry_name(job):
+    """ZIP entry name for a batch job's resume, safe to extract anywhere."""
+    return f"resume-{safe_entry_name(job.job_name)}-{safe_entry_name(job.job_id)}.pdf"
+
+def batch_job_status(job, now):
+    return {"job_id": job.job_id, "job_name": job.job_name, "status": batch_job_state(job, now),
+            "file_name": batch_entry_name(job)}
+
+@app.get("/tailor-resumes/{task_id}")
+async def tailor_resumes_status(task_id: str):
+    batch = await load_batch(task_id)
+    if not batch:
+        return JSONResponse(content={"Error": "Unknown task"}, status_code=404)
+    now = datetime.now(timezone.utc)
+    jobs = [batch_job_status(job, now) for job in batch]
+    return JSONResponse(content={
+        "jobs": jobs,
+        "done": sum(job["status"] in ("done", "failed") for job in jobs),
+        "total": len(jobs),
+        "isDone": all(job["status"] in ("done", "failed") for job in jobs),
+    })
+
+@app.get("/tailor-resumes/{task_id}/zip")
+async def tailor_resumes_zip(task_id: str):
+    """Stream the batch as a ZIP, adding each job's resume as soon as it is rendered."""
+    batch = await load_batch(task_id)
+    if not batch:
+        return JSONResponse(content={"Error": "Unknown task"}, status_code=404)
+
+    async def finished_resumes(batch):
+        sent = set()
+        while True:
+            now = datetime.now(timezone.utc)
+            for job in batch:
+                if job.job_id in sent or batch_job_state(job, now) != "done":
+                    continue
+                sent.add(job.job_id)
+                pdf = await pdf_cache.get(job.pdf_key)
+                if pdf is None:
+                    # Evicted, or rendered on another host: render the saved resume again.
+                    try:
+                        _, pdf = await render_batch_resume(await load_batch_resume(task_id, job.job_id))
+                    except Exception as e:
+                        print(f"Could not render resume for job {job.job_id}: {e}")
+                if pdf is not None:
+                    yield batch_entry_name(job), pdf
+            if all(batch_job_state(job, now) in ("done", "failed") for job in batch):
+                return
+            await asyncio.sleep(TAILOR_ZIP_POLL_INTERVAL)
+            batch = await load_batch(task_id)
+
+    return StreamingResponse(stream_zip(finished_resumes(batch)), media_type="application/zip",
+                             headers={"Content-Disposition": f'attachment; filename="resumes_{task_id}.zip"'})
+
+# Part of every cover-letter PDF cache key: bump whenever cover_letter_pdf output changes.
+LETTER_TEMPLATE_VERSION = "letter-1"
+
+def cover_letter_pdf(text: str):
+    pdf = pdf_fonts.new_document()
     pdf.add_page()
     pdf.set_auto_page_break(auto=True, margin=15)
     pdf.set_font("NotoSans", size=10)
     pdf.multi_cell(w=0, h=7, txt=text)
-    pdf.output(filename)
+    return pdf.output(dest="S").encode("latin-1")
 
 
 @app.post("/generate-cover-letter")
-async def generate_tailored_resume(request: Request, background_tasks: BackgroundTasks):
+async def generate_tailored_resume(request: Request):
     data = await request.json()
     resume = data['resume']
     job_desc = data['job_desc']
-    rand_uuid = str(uuid.uuid1().int)
-    os.makedirs("cover-letter/", exist_ok=True)
-    directory = "cover-letter/"
-    completion = openai_client.chat.completions.create(
+    response = await complete(
+        "generate-cover-letter",
         model="gpt-4.1-nano-2025-04-14",
         messages=[
             {
@@ -397,25 +819,24 @@ async def generate_tailored_resume(request: Request, background_tasks: Backgroun
         max_tokens=1024,
     )
 
-    response = completion.choices[0].message.content
-    create_pdf_from_string(response, f"{directory}{rand_uuid}.pdf")
-    background_tasks.add_task(delete_files, directory, rand_uuid)
-    return FileResponse(path=directory + rand_uuid + ".pdf",
-                        filename=f"{rand_uuid}.pdf",
-                        media_type="application/pdf")
+    key = document_key(response, LETTER_TEMPLATE_VERSION)
+    pdf = await pdf_cache.get(key)
+    if pdf is None:
+        pdf = await asyncio.to_thread(cover_letter_pdf, response)
+        await pdf_cache.set(key, pdf)
+    return Response(content=pdf, media_type="application/pdf",
+                    headers={"Content-Disposition": f'attachment; filename="cover_letter_{key[:16]}.pdf"'})
 
-@app.post("/find-questions")
-async def find_questions(request: Request):
-    data = await request.json()
-    job_name = data['job_name']
-    job_desc = data['job_desc']
-    job_req = data['job_req']
-    user_info = data["user_info"]
-    unique_id = data["unique_id"]
+SEARCH_MODEL = "gpt-4o-mini-search-preview-2025-03-11"
+# Category name -> JobQuestions column it is saved to.
+QUESTION_COLUMNS = {"technical": "tech_questions", "hr": "hr_questions", "leetcode": "lc_questions"}
+# How long one find-questions search may run before its still-empty categories count as failed.
+QUESTION_SEARCH_LEASE = int(os.getenv("QUESTION_SEARCH_LEASE", "300"))
+background_jobs = set()
 
-    completion_tech = openai_client.chat.completions.create(
-        model="gpt-4o-mini-search-preview-2025-03-11",
-        messages=[
+def question_prompts(job_name, job_desc, job_req, user_info):
+    return {
+        "technical": [
             {
                 "role": "system",
                     "content": [
@@ -451,13 +872,8 @@ async def find_questions(request: Request):
                         }
                     ]
             }
-        ]
-    )
-    response_tech = completion_tech.choices[0].message.content
-    
-    completion_hr = openai_client.chat.completions.create(
-        model="gpt-4o-mini-search-preview-2025-03-11",
-        messages=[
+        ],
+        "hr": [
             {
                 "role": "system",
                     "content": [
@@ -491,13 +907,8 @@ async def find_questions(request: Request):
                         }
                     ]
             }
-        ]
-    )
-    response_hr = completion_hr.choices[0].message.content
-    
-    completion_lc = openai_client.chat.completions.create(
-        model="gpt-4o-mini-search-preview-2025-03-11",
-        messages=[
+        ],
+        "leetcode": [
             {
                 "role": "system",
                     "content": [
@@ -541,37 +952,160 @@ async def find_questions(request: Request):
                         }
                     ]
             }
-        ]
-    )
-    response_lc_raw = completion_lc.choices[0].message.content
+        ],
+    }
+
+def parse_leetcode_questions(response_lc_raw):
     cleaned = response_lc_raw.strip().lstrip(r"```json").rstrip(r"```")
-    response_lc = json.loads(cleaned)
-    
-    job_uuid = get_job_uuid(unique_id, job_name)
-    row = JobQuestions(job_uuid, unique_id, job_name, response_tech, response_hr, response_lc)
-    session.add(row)
-    session.commit()
+    return json.loads(cleaned)
+
+def question_status(row):
+    """Per-category status read off the saved row, so any worker can answer: a saved column is done,
+    an empty one is pending while the search lease runs and failed once it has ended."""
+    searching = row.searching_until is not None and row.searching_until > datetime.now(timezone.utc)
+    return {
+        category: "done" if getattr(row, column) is not None else "pending" if searching else "failed"
+        for category, column in QUESTION_COLUMNS.items()
+    }
+
+async def search_question_category(job_uuid, unique_id, category, messages):
+    try:
+        async with llm_semaphore:
+            response = await llm_provider.complete(SEARCH_MODEL, messages)
+        if category == "leetcode":
+            response = parse_leetcode_questions(response)
+        async with Session() as session:
+            await session.execute(
+                update(JobQuestions)
+                .where(JobQuestions.job_id == job_uuid)
+                .values({QUESTION_COLUMNS[category]: response})
+            )
+            await bump_version(session, unique_id)
+            await session.commit()
+    except Exception as e:
+        print(f"Finding {category} questions for {job_uuid} failed: {e}")
+
+async def search_questions(job_uuid, unique_id, prompts):
+    await asyncio.gather(*[
+        search_question_category(job_uuid, unique_id, category, messages) for category, messages in prompts.items()
+    ])
+    # End the lease: categories still empty now read as failed, and a retry can claim the search again.
+    async with Session() as session:
+        await session.execute(update(JobQuestions).where(JobQuestions.job_id == job_uuid).values(searching_until=None))
+        await session.commit()
+
+@app.post("/find-questions")
+async def find_questions(request: Request):
+    data = await request.json()
+    job_name = data['job_name']
+    job_desc = data['job_desc']
+    job_req = data['job_req']
+    user_info = data["user_info"]
+    unique_id = data["unique_id"]
+
+    async with Session() as session:
+        job_uuid = await get_job_uuid(session, unique_id, job_name)
+        # Claim the search with a lease, unless every category is saved or another search holds one.
+        row = await session.scalar(claim_lease(
+            JobQuestions, JobQuestions.job_id, JobQuestions.searching_until, QUESTION_SEARCH_LEASE,
+            or_(*[getattr(JobQuestions, column).is_(None) for column in QUESTION_COLUMNS.values()]),
+            job_id=job_uuid, unique_id=unique_id, job_name=job_name,
+        ))
+        claimed = row is not None
+        if not claimed:
+            row = await session.scalar(select(JobQuestions).where(JobQuestions.job_id == job_uuid))
+        await bump_version(session, unique_id)
+        await session.commit()
+
+    if claimed:
+        # Only search for categories that are not saved yet, so a retry after a failure is cheap.
+        prompts = {
+            category: messages
+            for category, messages in question_prompts(job_name, job_desc, job_req, user_info).items()
+            if getattr(row, QUESTION_COLUMNS[category]) is None
+        }
+        job = asyncio.create_task(search_questions(job_uuid, unique_id, prompts))
+        background_jobs.add(job)
+        job.add_done_callback(background_jobs.discard)
+
+    # The job id doubles as the task id: progress lives in job_questions, not in this process.
+    return JSONResponse(content={"task_id": job_uuid, "status": question_status(row)}, status_code=202)
+
+@app.get("/find-questions/{task_id}")
+async def find_questions_status(task_id: str, session: AsyncSession = Depends(get_session)):
+    row = await session.scalar(select(JobQuestions).where(JobQuestions.job_id == task_id))
+    if row is None:
+        return JSONResponse(content={"Error": "Unknown task"}, status_code=404)
+    status = question_status(row)
+    return JSONResponse(content={
+        "status": status,
+        "isDone": all(category_status != "pending" for category_status in status.values()),
+        "technical_questions": row.tech_questions,
+        "hr_questions": row.hr_questions,
+        "leetcode_questions": row.lc_questions
+    })
 
 
 @app.get("/get-questions")
-async def get_questions(request: Request):
+async def get_questions(request: Request, session: AsyncSession = Depends(get_session)):
     data = await request.json()
     job_name = data['job_name']
     unique_id = data["unique_id"]
-    job_uuid = get_job_uuid(unique_id, job_name)
-    row = session.query(JobQuestions).filter(and_(
+    etag = await user_etag(session, unique_id)
+    if cached := not_modified(request, etag):
+        return cached
+    job_uuid = await get_job_uuid(session, unique_id, job_name)
+    row = await session.scalar(select(JobQuestions).where(and_(
                 JobQuestions.job_id == job_uuid,
                 JobQuestions.job_name == job_name,
                 JobQuestions.unique_id == unique_id
-            )).first()
+            )))
     if row:
         return JSONResponse(content={
-            "isFound" : True,
+            "isFound" : all(getattr(row, column) is not None for column in QUESTION_COLUMNS.values()),
             "technical_questions" : row.tech_questions,
             "hr_questions": row.hr_questions,
             "leetcode_questions": row.lc_questions
-        })
-    return JSONResponse(content={"isFound" : False})
+        }, headers=etag_headers(etag))
+    return JSONResponse(content={"isFound" : False}, headers=etag_headers(etag))
+
+
+# Field group -> (table it needs joined, columns it returns as {response key: column}).
+BUNDLE_FIELDS = {
+    "details": (Jobs, {"job_url": Jobs.job_url, "description": Jobs.job_desc, "requirements": Jobs.job_req}),
+    "questions": (JobQuestions, {
+        "technical_questions": JobQuestions.tech_questions,
+        "hr_questions": JobQuestions.hr_questions,
+        "leetcode_questions": JobQuestions.lc_questions,
+    }),
+}
+
+@app.get("/job-bundle")
+async def job_bundle(request: Request, unique_id: str, fields: str = "details,questions", job_name: str = None,
+                     session: AsyncSession = Depends(get_session)):
+    """Every saved job of a user (or just `job_name`) with the requested field groups, from one joined query."""
+    groups = [group for group in fields.split(",") if group in BUNDLE_FIELDS]
+    etag = await user_etag(session, unique_id)
+    if cached := not_modified(request, etag):
+        return cached
+
+    columns = {"job_id": UserJobs.job_id, "job_name": UserJobs.job_name}
+    stmt = select(UserJobs).where(UserJobs.unique_id == unique_id)
+    for group in groups:
+        table, group_columns = BUNDLE_FIELDS[group]
+        stmt = stmt.outerjoin(table, table.job_id == UserJobs.job_id)
+        columns.update(group_columns)
+    stmt = stmt.with_only_columns(*[column.label(key) for key, column in columns.items()])
+    if job_name is not None:
+        stmt = stmt.where(UserJobs.job_name == job_name)
+
+    jobs = []
+    for row in (await session.execute(stmt)).mappings():
+        job = dict(row)
+        if "questions" in groups:
+            job["isFound"] = all(job[key] is not None for key in BUNDLE_FIELDS["questions"][1])
+        jobs.append(job)
+    return JSONResponse(content={"jobs": jobs}, headers=etag_headers(etag))
 
 
 @app.get("/get-leetcode-description")
@@ -579,38 +1113,68 @@ async def get_questions(request: Request):
     data = await request.json()
     question = data['question']
     url = data["url"]
-    row = session.query(LeetCodeQuestions).filter(LeetCodeQuestions.url == url).first()
-    if row:
-        return JSONResponse(content={
-            "question" : row.question,
-            "url": row.url,
-            "desc": row.desc
-        })
-    else:
-        response = openai_client.chat.completions.create(
-                model="o4-mini",
-                messages=[
-                            {
-                                "role": "system",
-                                "content": (
-                                    "You are a Leetcode expert. You are given a Leetcode question along with its URL. "
-                                    "Provide a very brief description to solve the problem. Only provide the necessary steps "
-                                    "in bulleted points with newline characters to differentiate each point. "
-                                    "Do not include any notes/comments along with the response."
-                                )
-                            },
-                            {
-                                "role": "user",
-                                "content": f"Question: {question}\nURL: {url}"
-                            }
-                        ],
+    async with Session() as session:
+        row = await session.scalar(select(LeetCodeQuestions).where(LeetCodeQuestions.url == url))
+    if not row or row.desc is None:
+        row = await flights.do(f"leetcode:{url}", lambda: create_leetcode_description(question, url))
+    return JSONResponse(content={
+        "question" : row.question,
+        "url": row.url,
+        "desc": row.desc
+    })
+
+async def create_leetcode_description(question, url):
+    """Ask o4-mini for a solution sketch and save it; one worker at a time per URL."""
+    async def claim():
+        async with Session.begin() as session:
+            return await session.scalar(claim_lease(
+                LeetCodeQuestions, LeetCodeQuestions.url, LeetCodeQuestions.generating_until, LEETCODE_LEASE,
+                LeetCodeQuestions.desc.is_(None),
+                question=question, url=url,
+            ))
+
+    async def load_finished():
+        async with Session() as session:
+            return await session.scalar(select(LeetCodeQuestions).where(and_(
+                LeetCodeQuestions.url == url,
+                LeetCodeQuestions.desc.is_not(None)
+            )))
+
+    _, row = await claim_or_wait(claim, load_finished)
+    if row is not None:
+        return row
+
+    try:
+        async with llm_semaphore:
+            leetcode_response = await llm_provider.complete(
+                    model="o4-mini",
+                    messages=[
+                                {
+                                    "role": "system",
+                                    "content": (
+                                        "You are a Leetcode expert. You are given a Leetcode question along with its URL. "
+                                        "Provide a very brief description to solve the problem. Only provide the necessary steps "
+                                        "in bulleted points with newline characters to differentiate each point. "
+                                        "Do not include any notes/comments along with the response."
+                                    )
+                                },
+                                {
+                                    "role": "user",
+                                    "content": f"Question: {question}\nURL: {url}"
+                                }
+                            ],
+                )
+    except Exception:
+        async with Session.begin() as session:
+            await session.execute(
+                update(LeetCodeQuestions).where(LeetCodeQuestions.url == url).values(generating_until=None)
             )
-        leetcode_response = response.choices[0].message.content
-        row = LeetCodeQuestions(question, url, leetcode_response)
-        session.add(row)
-        session.commit()
-        return JSONResponse(content={
-            "question" : row.question,
-            "url": row.url,
-            "desc": row.desc
-        })
\ No newline at end of file
+        raise
+
+    async with Session.begin() as session:
+        await session.execute(
+            update(LeetCodeQuestions)
+            .where(LeetCodeQuestions.url == url)
+            .values(desc=leetcode_response, generating_until=None)
+        )
+    return LeetCodeQuestions(question, url, leetcode_response)
@@ -0,0 +1,57 @@
+"""Benchmark: pdflatex compile latency for one resume, cold against the precompiled preamble format.
+
+    python bench_latex_format.py [--repeat 10]
+
+Needs pdflatex with the packages the resume uses (the backend image has them). Renders the
+bench_render PROFILE once, dumps the format if it is not there yet, and compiles the same
+.tex in a scratch directory with and without -fmt.
+"""
+import argparse
+import asyncio
+import os
+import shutil
+import statistics
+import subprocess
+import tempfile
+import time
+
+import resume
+from bench_render import PROFILE
+
+
+def compile_once(workspace, use_format):
+    args = ["pdflatex", "--interaction=nonstopmode"]
+    env = None
+    if use_format:
+        args.append(f"-fmt={resume.FORMAT_NAME}")
+        env = {**os.environ, "TEXFORMATS": f"{resume.FORMAT_DIR}:"}
+    started = time.perf_counter()
+    result = subprocess.run([*args, "resume.tex"], cwd=workspace, env=env, stdin=subprocess.DEVNULL,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    elapsed = time.perf_counter() - started
+    if result.returncode != 0 or not os.path.exists(f"{workspace}/resume.pdf"):
+        raise SystemExit(f"pdflatex failed (exit {result.returncode}) {'with' if use_format else 'without'} the format")
+    os.remove(f"{workspace}/resume.pdf")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+    if shutil.which("pdflatex") is None:
+        parser.error("pdflatex is not on PATH")
+    if not asyncio.run(resume.ensure_format()):
+        parser.error(f"could not build the LaTeX format in {resume.FORMAT_DIR}")
+
+    with tempfile.TemporaryDirectory() as workspace:
+        resume.write_tex(f"{workspace}/resume.tex", resume.render_latex(PROFILE))
+        print(f"{'compile':>10} {'median':>10} {'min':>10}")
+        for label, use_format in (("cold", False), ("-fmt", True)):
+            compile_once(workspace, use_format)
+            runs = [compile_once(workspace, use_format) for _ in range(args.repeat)]
+            print(f"{label:>10} {statistics.median(runs) * 1000:>7.1f} ms {min(runs) * 1000:>7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
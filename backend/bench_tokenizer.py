@@ -0,0 +1,76 @@
+"""Microbenchmark: tokenizer.truncate against the old encode-everything truncation on 1 MB and 5 MB pages.
+
+    python bench_tokenizer.py [--repeat 5]
+
+Needs only tiktoken (and its cached BPE file). Pages are synthetic job-board HTML: markup,
+inline scripts and JSON around a few kilobytes of posting text, repeated up to the target size.
+"""
+import argparse
+import random
+import statistics
+import time
+
+import tiktoken
+
+import tokenizer
+
+SIZES = {"1 MB": 1024 * 1024, "5 MB": 5 * 1024 * 1024}
+MAX_TOKENS = 100_000  # JOB_PAGE_MAX_TOKENS in app.py
+WORDS = ("engineer platform python distributed latency customers ownership design review kubernetes "
+         "postgres observability mentor roadmap quality deploy incident scale team product").split()
+
+
+def old_truncate(text, model=tokenizer.DEFAULT_MODEL):
+    """truncate_to_200k_tokens as it was: look the encoder up, encode the whole page, decode a prefix."""
+    enc = tiktoken.encoding_for_model(model)
+    tokens = enc.encode_ordinary(text)
+    return enc.decode(tokens[:MAX_TOKENS])
+
+
+def synthetic_page(size, seed=0):
+    rng = random.Random(seed)
+    blocks = []
+    length = 0
+    while length < size:
+        words = " ".join(rng.choice(WORDS) for _ in range(60))
+        block = (
+            f'<div class="job-card" data-id="{rng.getrandbits(48):x}"><h2>{words[:40]}</h2>'
+            f'<p>{words}</p><ul><li>{words[:120]}</li><li>{words[120:240]}</li></ul></div>\n'
+            f'<script>window.__STATE__["{rng.getrandbits(32):x}"] = {{"impressions": {rng.randint(0, 10**6)}, '
+            f'"tracking": "{rng.getrandbits(128):x}"}};</script>\n'
+        )
+        blocks.append(block)
+        length += len(block)
+    return "<html><body>" + "".join(blocks) + "</body></html>"
+
+
+def timed(fn, repeat):
+    runs = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        runs.append(time.perf_counter() - started)
+    return statistics.median(runs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    tokenizer.get_encoding()
+    print(f"encoder load (once per process): {(time.perf_counter() - started) * 1000:.1f} ms")
+
+    print(f"{'page':>6} {'old truncate':>14} {'truncate':>10} {'speedup':>8} {'count_tokens':>13}")
+    for label, size in SIZES.items():
+        page = synthetic_page(size)
+        assert tokenizer.truncate(page, MAX_TOKENS) == old_truncate(page)
+        old = timed(lambda: old_truncate(page), args.repeat)
+        new = timed(lambda: tokenizer.truncate(page, MAX_TOKENS), args.repeat)
+        count = timed(lambda: tokenizer.count_tokens(page), args.repeat)
+        print(f"{label:>6} {old * 1000:>11.1f} ms {new * 1000:>7.1f} ms {old / new:>7.1f}x {count * 1000:>10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
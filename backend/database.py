@@ -0,0 +1,36 @@
+import os
+
+from sqlalchemy.engine import URL
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+from dotenv import load_dotenv
+load_dotenv()
+
+DATABASE_URL = URL.create(
+    drivername=os.getenv("PSQL_ASYNC_DRIVERNAME", "postgresql+asyncpg"),
+    username=os.getenv("PSQL_USERNAME"),
+    password=os.getenv("PSQL_PASSWORD"),
+    host=os.getenv("PSQL_HOST"),
+    port=os.getenv("PSQL_PORT"),
+    database=os.getenv("PSQL_DATABASE")
+)
+
+# The one engine for the process. Connections are checked for liveness before use and
+# recycled before server-side idle timeouts can drop them.
+engine = create_async_engine(
+    DATABASE_URL,
+    echo=os.getenv("SQL_ECHO", "false").lower() in ("1", "true", "yes"),
+    pool_size=int(os.getenv("DB_POOL_SIZE", "10")),
+    max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "20")),
+    pool_timeout=float(os.getenv("DB_POOL_TIMEOUT", "30")),
+    pool_recycle=int(os.getenv("DB_POOL_RECYCLE", "1800")),
+    pool_pre_ping=True,
+)
+
+Session = async_sessionmaker(bind=engine, expire_on_commit=False)
+
+
+async def get_session():
+    """FastAPI dependency: one session per request, closed (and rolled back if uncommitted) afterwards."""
+    async with Session() as session:
+        yield session
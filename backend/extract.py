@@ -0,0 +1,144 @@
+import json
+import re
+from html.parser import HTMLParser
+
+# Elements whose content is never visible text.
+HIDDEN_TAGS = {"script", "style", "noscript", "template", "svg", "iframe", "object", "canvas", "select", "button"}
+# Page chrome: only used when the page has no other usable text.
+CHROME_TAGS = {"nav", "header", "footer", "aside", "form"}
+BLOCK_TAGS = {
+    "p", "div", "section", "article", "main", "li", "ul", "ol", "br", "tr", "table",
+    "h1", "h2", "h3", "h4", "h5", "h6", "dt", "dd", "title", "blockquote", "pre",
+}
+VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"}
+MIN_MAIN_CHARS = 500
+
+
+class JobPageExtractor(HTMLParser):
+    """Streaming HTML-to-text pass that keeps visible main text and any JSON-LD JobPosting.
+
+    Feed it chunks as they arrive with `feed()`, then call `close()` and `text()`.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.body = []
+        self.main = []
+        self.chrome = []
+        self.job_postings = []
+        self._hidden = []
+        self._chrome_depth = 0
+        # Open elements from the <main> (or role="main") element inward; empty outside main.
+        self._main = []
+        self._ld_json = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag in VOID_TAGS:
+            if tag == "br":
+                self._append("\n")
+            return
+        attrs = dict(attrs)
+        if self._hidden:
+            self._hidden.append(tag)
+            return
+        if tag == "script" and (attrs.get("type") or "").lower() == "application/ld+json":
+            self._ld_json = []
+            self._hidden.append(tag)
+            return
+        if tag in HIDDEN_TAGS:
+            self._hidden.append(tag)
+            return
+        if tag in CHROME_TAGS:
+            # A header or aside inside main is part of the content, e.g. an article's title.
+            if not self._main:
+                self._chrome_depth += 1
+            self._append("\n")
+        if self._main or tag == "main" or attrs.get("role") == "main":
+            self._main.append(tag)
+        if tag in BLOCK_TAGS:
+            self._append("\n")
+
+    def handle_endtag(self, tag):
+        if tag in VOID_TAGS:
+            return
+        if self._hidden:
+            # Pop back to the matching start tag; tolerates unclosed children.
+            if tag in self._hidden:
+                while self._hidden.pop() != tag:
+                    pass
+                if not self._hidden and self._ld_json is not None:
+                    self._collect_ld_json("".join(self._ld_json))
+                    self._ld_json = None
+            return
+        if tag in CHROME_TAGS and self._chrome_depth and not self._main:
+            self._chrome_depth -= 1
+        if tag in self._main:
+            # Pop back to the matching start tag; stray end tags that match nothing open are ignored.
+            while self._main.pop() != tag:
+                pass
+        if tag in BLOCK_TAGS:
+            self._append("\n")
+
+    def handle_data(self, data):
+        if self._hidden:
+            if self._ld_json is not None:
+                self._ld_json.append(data)
+            return
+        self._append(data)
+
+    def _append(self, data):
+        if self._chrome_depth:
+            self.chrome.append(data)
+            return
+        self.body.append(data)
+        if self._main:
+            self.main.append(data)
+
+    def _collect_ld_json(self, raw):
+        try:
+            data = json.loads(raw)
+        except ValueError:
+            return
+        stack = [data]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, list):
+                stack.extend(node)
+            elif isinstance(node, dict):
+                types = node.get("@type")
+                types = types if isinstance(types, list) else [types]
+                if "JobPosting" in types:
+                    if isinstance(node.get("description"), str):
+                        node = {**node, "description": html_to_text(node["description"])}
+                    self.job_postings.append(node)
+                elif "@graph" in node:
+                    stack.append(node["@graph"])
+
+    def text(self):
+        main = collapse_whitespace("".join(self.main))
+        body = collapse_whitespace("".join(self.body))
+        if len(main) >= MIN_MAIN_CHARS:
+            visible = main
+        elif len(body) >= MIN_MAIN_CHARS:
+            visible = body
+        else:
+            visible = collapse_whitespace(body + "\n" + "".join(self.chrome))
+
+        parts = [
+            "JobPosting JSON-LD: " + json.dumps(posting, ensure_ascii=False, separators=(",", ":"))
+            for posting in self.job_postings
+        ]
+        parts.append(visible)
+        return "\n\n".join(part for part in parts if part)
+
+
+def collapse_whitespace(text):
+    lines = (re.sub(r"[ \t\r\f\v\xa0]+", " ", line).strip() for line in text.split("\n"))
+    return "\n".join(line for line in lines if line)
+
+
+def html_to_text(html):
+    extractor = JobPageExtractor()
+    extractor.feed(html)
+    extractor.close()
+    return extractor.text()
@@ -0,0 +1,170 @@
+"""Deterministic stand-in for the OpenAI chat-completions API, for offline load tests.
+
+Run with `uvicorn fake_llm:app --port 8100` and start the backend with LLM_PROVIDER=fake.
+
+Environment:
+    FAKE_LLM_LATENCY            time to first token: "fixed:0.3", "uniform:0.2,1.5" or "lognormal:0.5,0.6"
+                                (median seconds, sigma). Defaults to "lognormal:0.5,0.6".
+    FAKE_LLM_TOKENS_PER_SECOND  generation throughput after the first token. Defaults to 80.
+    FAKE_LLM_SEED               seed for the latency RNG, for repeatable runs.
+"""
+import asyncio
+import hashlib
+import json
+import math
+import os
+import random
+import re
+import time
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+LEETCODE_PROBLEMS = [
+    ("Two Sum", "two-sum"),
+    ("Add Two Numbers", "add-two-numbers"),
+    ("Longest Substring Without Repeating Characters", "longest-substring-without-repeating-characters"),
+    ("Valid Parentheses", "valid-parentheses"),
+    ("Merge Intervals", "merge-intervals"),
+    ("LRU Cache", "lru-cache"),
+    ("Number of Islands", "number-of-islands"),
+    ("Course Schedule", "course-schedule"),
+    ("Top K Frequent Elements", "top-k-frequent-elements"),
+    ("Product of Array Except Self", "product-of-array-except-self"),
+    ("Word Break", "word-break"),
+    ("Coin Change", "coin-change"),
+    ("Kth Largest Element in an Array", "kth-largest-element-in-an-array"),
+    ("Binary Tree Level Order Traversal", "binary-tree-level-order-traversal"),
+    ("Lowest Common Ancestor of a Binary Tree", "lowest-common-ancestor-of-a-binary-tree"),
+    ("Serialize and Deserialize Binary Tree", "serialize-and-deserialize-binary-tree"),
+    ("Trapping Rain Water", "trapping-rain-water"),
+    ("Median of Two Sorted Arrays", "median-of-two-sorted-arrays"),
+    ("Search in Rotated Sorted Array", "search-in-rotated-sorted-array"),
+    ("Group Anagrams", "group-anagrams"),
+    ("Clone Graph", "clone-graph"),
+    ("Meeting Rooms II", "meeting-rooms-ii"),
+    ("Rotting Oranges", "rotting-oranges"),
+    ("Design Hit Counter", "design-hit-counter"),
+    ("Min Stack", "min-stack"),
+]
+FILLER = (
+    "The team builds reliable services and data pipelines, works closely with product partners, "
+    "reviews code, owns features end to end and improves performance, testing and observability."
+).split()
+
+app = FastAPI()
+latency_rng = random.Random(os.getenv("FAKE_LLM_SEED"))
+
+
+def sample_latency(spec):
+    kind, _, args = spec.partition(":")
+    values = [float(v) for v in args.split(",") if v]
+    if kind == "fixed":
+        return values[0]
+    if kind == "uniform":
+        return latency_rng.uniform(values[0], values[1])
+    if kind == "lognormal":
+        return latency_rng.lognormvariate(math.log(values[0]), values[1])
+    raise ValueError(f"Unknown FAKE_LLM_LATENCY: {spec}")
+
+
+def message_text(message):
+    content = message.get("content") or ""
+    if isinstance(content, list):
+        return "\n".join(part.get("text", "") for part in content if isinstance(part, dict))
+    return content
+
+
+def canned_response(model, messages):
+    """Pick a deterministic, well-formed answer for whichever CareerHub prompt this is."""
+    prompt = "\n".join(message_text(m) for m in messages)
+    seed = int(hashlib.sha256(f"{model}\n{prompt}".encode("utf-8")).hexdigest(), 16)
+    rng = random.Random(seed)
+
+    if "Leetcode questions" in prompt and "JSON" in prompt:
+        problems = rng.sample(LEETCODE_PROBLEMS, 25)
+        return json.dumps([{title: f"https://leetcode.com/problems/{slug}/"} for title, slug in problems], indent=4)
+    if "Leetcode expert" in prompt:
+        return "\n".join(f"- Step {i}: {' '.join(rng.sample(FILLER, 8))}." for i in range(1, 6))
+    if "Resume section:" in prompt:
+        section = prompt.split("Resume section:", 1)[1].split("Job Description:", 1)[0].strip()
+        lines = [line.strip() for line in section.split("\n") if line.strip()] or ["Delivered project work"]
+        return "\n".join(f"{line} using {rng.choice(FILLER)} practices" for line in lines)
+    if "Cover Letter" in prompt:
+        body = " ".join(rng.choice(FILLER) for _ in range(220))
+        return f"Jane Doe\njane@example.com\n+1 555 0100\n\nDear Hiring Team,\n\n{body}.\n\nSincerely,\nJane Doe"
+    if "HR questions" in prompt or "technical questions" in prompt:
+        return "\n\n".join(
+            f"{i}. {' '.join(rng.sample(FILLER, 10)).capitalize()}?\n   Tip: {' '.join(rng.sample(FILLER, 12))}."
+            for i in range(1, 16)
+        )
+    return " ".join(rng.choice(FILLER) for _ in range(200)) + "."
+
+
+def split_tokens(text):
+    """Rough token stream: words with their trailing whitespace."""
+    return re.findall(r"\S+\s*|\s+", text)
+
+
+def completion_body(completion_id, model, text, prompt_tokens, completion_tokens, finish_reason):
+    return {
+        "id": completion_id,
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [{
+            "index": 0,
+            "message": {"role": "assistant", "content": text},
+            "finish_reason": finish_reason,
+        }],
+        "usage": {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        },
+    }
+
+
+def chunk_body(completion_id, model, created, delta, finish_reason=None):
+    return {
+        "id": completion_id,
+        "object": "chat.completion.chunk",
+        "created": created,
+        "model": model,
+        "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+    }
+
+
+@app.post("/v1/chat/completions")
+async def chat_completions(request: Request):
+    body = await request.json()
+    model = body.get("model", "fake")
+    messages = body.get("messages", [])
+    max_tokens = body.get("max_tokens") or body.get("max_completion_tokens")
+
+    tokens = split_tokens(canned_response(model, messages))
+    finish_reason = "stop"
+    if max_tokens and len(tokens) > max_tokens:
+        tokens = tokens[:max_tokens]
+        finish_reason = "length"
+    prompt_tokens = sum(len(split_tokens(message_text(m))) for m in messages)
+    completion_id = "chatcmpl-fake-" + hashlib.sha256(json.dumps(messages).encode("utf-8")).hexdigest()[:24]
+    first_token_delay = sample_latency(os.getenv("FAKE_LLM_LATENCY", "lognormal:0.5,0.6"))
+    token_delay = 1 / float(os.getenv("FAKE_LLM_TOKENS_PER_SECOND", "80"))
+
+    if body.get("stream"):
+        async def events():
+            created = int(time.time())
+            await asyncio.sleep(first_token_delay)
+            yield f"data: {json.dumps(chunk_body(completion_id, model, created, {'role': 'assistant', 'content': ''}))}\n\n"
+            for token in tokens:
+                yield f"data: {json.dumps(chunk_body(completion_id, model, created, {'content': token}))}\n\n"
+                await asyncio.sleep(token_delay)
+            yield f"data: {json.dumps(chunk_body(completion_id, model, created, {}, finish_reason))}\n\n"
+            yield "data: [DONE]\n\n"
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    await asyncio.sleep(first_token_delay + token_delay * len(tokens))
+    return JSONResponse(content=completion_body(
+        completion_id, model, "".join(tokens), prompt_tokens, len(tokens), finish_reason
+    ))
@@ -0,0 +1,103 @@
+import asyncio
+import codecs
+from dataclasses import dataclass
+
+import httpx
+
+
+# Decoded text is handed to a sink in pieces of about this many bytes.
+SINK_CHUNK_BYTES = 64 * 1024
+
+
+class FetchError(Exception):
+    pass
+
+
+@dataclass
+class FetchResult:
+    url: str
+    status_code: int
+    text: str = ""
+    etag: str = None
+    last_modified: str = None
+    truncated: bool = False
+    size: int = 0
+
+    @property
+    def not_modified(self):
+        return self.status_code == 304
+
+
+class PageFetcher:
+    """Shared, pooled fetcher for job pages with timeouts, a streaming byte cap and conditional GETs."""
+
+    def __init__(self, connect_timeout=5.0, read_timeout=15.0, total_timeout=30.0,
+                 max_bytes=5 * 1024 * 1024, max_redirects=5, max_connections=50):
+        self.total_timeout = total_timeout
+        self.max_bytes = max_bytes
+        self.client = httpx.AsyncClient(
+            timeout=httpx.Timeout(read_timeout, connect=connect_timeout),
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections // 2),
+            follow_redirects=True,
+            max_redirects=max_redirects,
+            headers={"User-Agent": "Mozilla/5.0"},
+        )
+
+    async def fetch(self, url, etag=None, last_modified=None, sink=None):
+        """GET `url`, revalidating with the stored validators when given; a 304 comes back with no text.
+
+        With a `sink` (anything with a `feed(text)` method, such as an HTMLParser), the decoded body is
+        fed to it chunk by chunk, in a worker thread, as it arrives; it is then not kept in `text`.
+        """
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        try:
+            return await asyncio.wait_for(self._fetch(url, headers, sink), self.total_timeout)
+        except (asyncio.TimeoutError, httpx.TimeoutException):
+            raise FetchError(f"Timed out fetching {url}")
+        except httpx.TooManyRedirects:
+            raise FetchError(f"Too many redirects fetching {url}")
+        except httpx.HTTPError as e:
+            raise FetchError(f"Could not fetch {url}: {e}")
+
+    async def _fetch(self, url, headers, sink):
+        async with self.client.stream("GET", url, headers=headers) as response:
+            result = FetchResult(
+                url=str(response.url),
+                status_code=response.status_code,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+            )
+            if result.not_modified and headers:
+                return result
+            if response.status_code >= 300:
+                raise FetchError(f"{url} returned HTTP {response.status_code}")
+
+            try:
+                decoder = codecs.getincrementaldecoder(response.charset_encoding or "utf-8")(errors="replace")
+            except LookupError:
+                decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+            chunks = []
+            async for chunk in response.aiter_bytes(SINK_CHUNK_BYTES if sink else None):
+                if result.size + len(chunk) > self.max_bytes:
+                    chunk = chunk[:self.max_bytes - result.size]
+                    result.truncated = True
+                result.size += len(chunk)
+                if sink:
+                    await asyncio.to_thread(sink.feed, decoder.decode(chunk))
+                else:
+                    chunks.append(decoder.decode(chunk))
+                if result.truncated:
+                    break
+            if sink:
+                await asyncio.to_thread(sink.feed, decoder.decode(b"", final=True))
+            else:
+                chunks.append(decoder.decode(b"", final=True))
+                result.text = "".join(chunks)
+            return result
+
+    async def aclose(self):
+        await self.client.aclose()
@@ -0,0 +1,40 @@
+import os
+from abc import ABC, abstractmethod
+
+from openai import AsyncOpenAI
+
+
+class LLMProvider(ABC):
+    """Interface every endpoint uses to talk to a chat model."""
+
+    @abstractmethod
+    async def complete(self, model, messages, max_tokens=None):
+        """Return the assistant message text for a chat-completions request."""
+
+    async def aclose(self):
+        pass
+
+
+class OpenAIProvider(LLMProvider):
+    """Any server speaking the OpenAI chat-completions wire format (OpenAI itself, or fake_llm)."""
+
+    def __init__(self, api_key, base_url=None):
+        self.client = AsyncOpenAI(api_key=api_key, base_url=base_url)
+
+    async def complete(self, model, messages, max_tokens=None):
+        kwargs = {"max_tokens": max_tokens} if max_tokens else {}
+        completion = await self.client.chat.completions.create(model=model, messages=messages, **kwargs)
+        return completion.choices[0].message.content
+
+    async def aclose(self):
+        await self.client.close()
+
+
+def create_provider():
+    """Build the provider selected by LLM_PROVIDER: "openai" (default) or "fake" for offline load tests."""
+    provider = os.getenv("LLM_PROVIDER", "openai")
+    if provider == "openai":
+        return OpenAIProvider(api_key=os.getenv("OPENAI_API_KEY"), base_url=os.getenv("OPENAI_BASE_URL"))
+    if provider == "fake":
+        return OpenAIProvider(api_key="fake", base_url=os.getenv("FAKE_LLM_URL", "http://fake-llm:8100/v1"))
+    raise ValueError(f"Unknown LLM_PROVIDER: {provider}")
@@ -0,0 +1,64 @@
+import hashlib
+import json
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+
+from memory_cache import LRUCache
+from schemas import LLMCompletions
+
+
+def completion_key(model, messages, max_tokens):
+    """Content address of a completion request: sha256 over (model, messages, max_tokens)."""
+    payload = json.dumps([model, messages, max_tokens], sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class CompletionCache:
+    """Two-tier completion cache: an in-process LRU in front of the llm_completions table."""
+
+    def __init__(self, session_factory, max_entries=1024, memory_ttl=3600, db_ttl=30 * 24 * 3600):
+        self.session_factory = session_factory
+        self.memory = LRUCache(max_entries, ttl=memory_ttl)
+        self.db_ttl = db_ttl
+        self.counters = defaultdict(lambda: {"memory_hits": 0, "db_hits": 0, "misses": 0})
+
+    async def get(self, endpoint, key):
+        value = self.memory.get(key)
+        if value is not None:
+            self.counters[endpoint]["memory_hits"] += 1
+            return value
+
+        stmt = select(LLMCompletions.response).where(LLMCompletions.cache_key == key)
+        if self.db_ttl:
+            stmt = stmt.where(LLMCompletions.created_at > datetime.now(timezone.utc) - timedelta(seconds=self.db_ttl))
+        async with self.session_factory() as session:
+            value = await session.scalar(stmt)
+        if value is not None:
+            self.counters[endpoint]["db_hits"] += 1
+            self.memory.set(key, value)
+            return value
+
+        self.counters[endpoint]["misses"] += 1
+        return None
+
+    async def set(self, key, model, value):
+        self.memory.set(key, value)
+        stmt = insert(LLMCompletions).values(
+            cache_key=key, model=model, response=value, created_at=datetime.now(timezone.utc)
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[LLMCompletions.cache_key],
+            set_={"response": stmt.excluded.response, "created_at": stmt.excluded.created_at},
+        )
+        async with self.session_factory() as session:
+            await session.execute(stmt)
+            await session.commit()
+
+    def stats(self):
+        return {
+            endpoint: {**counts, "hits": counts["memory_hits"] + counts["db_hits"]}
+            for endpoint, counts in self.counters.items()
+        }
@@ -0,0 +1,47 @@
+import time
+from collections import OrderedDict
+
+
+class LRUCache:
+    """Bounded in-process LRU cache with an optional per-entry TTL in seconds.
+
+    With `max_bytes` set, values must support len() and the cache also evicts until their
+    combined length fits; a single value larger than `max_bytes` is not cached at all.
+    """
+
+    def __init__(self, max_entries, ttl=None, max_bytes=None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries = OrderedDict()
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at < time.monotonic():
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key, value):
+        if self.max_bytes is not None and len(value) > self.max_bytes:
+            return
+        self._remove(key)
+        expires_at = time.monotonic() + self.ttl if self.ttl else None
+        self._entries[key] = (value, expires_at)
+        if self.max_bytes is not None:
+            self.size += len(value)
+        while len(self._entries) > self.max_entries or (self.max_bytes is not None and self.size > self.max_bytes):
+            self._remove(next(iter(self._entries)))
+
+    def _remove(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None and self.max_bytes is not None:
+            self.size -= len(entry[0])
+
+    def __len__(self):
+        return len(self._entries)
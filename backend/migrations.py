@@ -0,0 +1,232 @@
+"""Versioned schema migrations, applied in order at startup.
+
+Each migration runs in its own transaction together with its schema_migrations row, under a
+Postgres advisory lock so several workers starting at once apply it exactly once. Append new
+migrations to MIGRATIONS; never edit or reorder ones that have shipped. Steps are plain SQL,
+never derived from the models, so a migration does the same thing however the models change later.
+"""
+from sqlalchemy import text
+
+MIGRATION_LOCK = "schema_migrations"
+
+
+MIGRATIONS = [
+    # The schema as the models stood when migrations were introduced; later changes are later
+    # migrations. Databases that predate migrations already have these tables.
+    (1, "create tables", [
+        """
+        CREATE TABLE IF NOT EXISTS login (
+            unique_id VARCHAR NOT NULL,
+            name VARCHAR,
+            PRIMARY KEY (unique_id)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS personal (
+            unique_id VARCHAR NOT NULL,
+            first_name VARCHAR,
+            last_name VARCHAR,
+            email VARCHAR,
+            phone VARCHAR,
+            linkedin TEXT,
+            github TEXT,
+            PRIMARY KEY (unique_id)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS education (
+            uid VARCHAR NOT NULL,
+            unique_id VARCHAR,
+            university TEXT,
+            degree TEXT,
+            start_year INTEGER,
+            graduation_year INTEGER,
+            gpa FLOAT,
+            description TEXT,
+            PRIMARY KEY (uid)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS work (
+            uid VARCHAR NOT NULL,
+            unique_id VARCHAR,
+            company TEXT,
+            location TEXT,
+            job_title TEXT,
+            start_year INTEGER,
+            end_year INTEGER,
+            work_desc TEXT,
+            PRIMARY KEY (uid)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS project (
+            uid VARCHAR NOT NULL,
+            unique_id VARCHAR,
+            project_name VARCHAR,
+            project_tech TEXT,
+            project_link TEXT,
+            project_desc TEXT,
+            PRIMARY KEY (uid)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS skills (
+            unique_id VARCHAR NOT NULL,
+            skills VARCHAR[],
+            PRIMARY KEY (unique_id)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS user_jobs (
+            job_id VARCHAR NOT NULL,
+            unique_id VARCHAR,
+            job_name VARCHAR,
+            PRIMARY KEY (job_id)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS jobs (
+            job_id VARCHAR NOT NULL,
+            unique_id VARCHAR,
+            job_name VARCHAR,
+            job_url TEXT,
+            job_desc TEXT,
+            job_req TEXT,
+            posting_id VARCHAR,
+            PRIMARY KEY (job_id)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS job_postings (
+            posting_id VARCHAR NOT NULL,
+            url TEXT,
+            job_desc TEXT,
+            job_req TEXT,
+            fetched_at TIMESTAMP WITH TIME ZONE,
+            etag TEXT,
+            last_modified TEXT,
+            PRIMARY KEY (posting_id)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS job_questions (
+            job_id VARCHAR NOT NULL,
+            unique_id VARCHAR,
+            job_name VARCHAR,
+            tech_questions TEXT,
+            hr_questions TEXT,
+            lc_questions JSON,
+            PRIMARY KEY (job_id)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS leetcode_questions (
+            question VARCHAR,
+            url VARCHAR NOT NULL,
+            "desc" TEXT,
+            PRIMARY KEY (url)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS llm_completions (
+            cache_key VARCHAR NOT NULL,
+            model VARCHAR,
+            response TEXT,
+            created_at TIMESTAMP WITH TIME ZONE,
+            PRIMARY KEY (cache_key)
+        )
+        """,
+    ]),
+    (2, "columns added before migrations existed", [
+        "ALTER TABLE jobs ADD COLUMN IF NOT EXISTS posting_id VARCHAR",
+        "ALTER TABLE job_postings ADD COLUMN IF NOT EXISTS etag TEXT",
+        "ALTER TABLE job_postings ADD COLUMN IF NOT EXISTS last_modified TEXT",
+    ]),
+    (3, "indexes for unique_id and job_name lookups", [
+        "CREATE INDEX IF NOT EXISTS ix_education_unique_id ON education (unique_id)",
+        "CREATE INDEX IF NOT EXISTS ix_work_unique_id ON work (unique_id)",
+        "CREATE INDEX IF NOT EXISTS ix_project_unique_id ON project (unique_id)",
+        "CREATE INDEX IF NOT EXISTS ix_jobs_unique_id_job_name ON jobs (unique_id, job_name)",
+        "CREATE INDEX IF NOT EXISTS ix_job_questions_unique_id_job_name ON job_questions (unique_id, job_name)",
+        # Keep the first copy of each duplicated job and drop everything saved against the others.
+        """
+        WITH duplicates AS (
+            DELETE FROM user_jobs dup USING user_jobs keep
+            WHERE dup.unique_id = keep.unique_id AND dup.job_name = keep.job_name AND dup.ctid > keep.ctid
+            RETURNING dup.job_id
+        ), removed_jobs AS (
+            DELETE FROM jobs WHERE job_id IN (SELECT job_id FROM duplicates)
+        )
+        DELETE FROM job_questions WHERE job_id IN (SELECT job_id FROM duplicates)
+        """,
+        # Also serves every user_jobs lookup by unique_id alone, as its leading column.
+        "ALTER TABLE user_jobs ADD CONSTRAINT uq_user_jobs_unique_id_job_name UNIQUE (unique_id, job_name)",
+    ]),
+    (4, "entry order for profile sections", [
+        "ALTER TABLE education ADD COLUMN IF NOT EXISTS position INTEGER",
+        "ALTER TABLE work ADD COLUMN IF NOT EXISTS position INTEGER",
+        "ALTER TABLE project ADD COLUMN IF NOT EXISTS position INTEGER",
+    ]),
+    (5, "per-user data version for ETags", [
+        "ALTER TABLE login ADD COLUMN IF NOT EXISTS version INTEGER NOT NULL DEFAULT 0",
+    ]),
+    (6, "creation time and keyset indexes for the job list", [
+        "ALTER TABLE user_jobs ADD COLUMN IF NOT EXISTS created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now()",
+        # Row-value comparisons on (sort column, job_id) walk these without scanning earlier pages.
+        "CREATE INDEX IF NOT EXISTS ix_user_jobs_unique_id_created_at ON user_jobs (unique_id, created_at, job_id)",
+        "CREATE INDEX IF NOT EXISTS ix_user_jobs_unique_id_job_name_job_id ON user_jobs (unique_id, job_name, job_id)",
+    ]),
+    (7, "find-questions search lease", [
+        "ALTER TABLE job_questions ADD COLUMN IF NOT EXISTS searching_until TIMESTAMP WITH TIME ZONE",
+    ]),
+    (8, "leases for shared posting refreshes and LeetCode descriptions", [
+        "ALTER TABLE job_postings ADD COLUMN IF NOT EXISTS refreshing_until TIMESTAMP WITH TIME ZONE",
+        "ALTER TABLE leetcode_questions ADD COLUMN IF NOT EXISTS generating_until TIMESTAMP WITH TIME ZONE",
+    ]),
+    (9, "batch tailoring jobs", [
+        """
+        CREATE TABLE IF NOT EXISTS tailor_batch_jobs (
+            task_id VARCHAR NOT NULL,
+            job_id VARCHAR NOT NULL,
+            unique_id VARCHAR,
+            job_name VARCHAR,
+            status VARCHAR NOT NULL,
+            resume JSON,
+            pdf_key VARCHAR,
+            tailoring_until TIMESTAMP WITH TIME ZONE,
+            created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+            PRIMARY KEY (task_id, job_id)
+        )
+        """,
+        # Expired batches are deleted by creation time.
+        "CREATE INDEX IF NOT EXISTS ix_tailor_batch_jobs_created_at ON tailor_batch_jobs (created_at)",
+    ]),
+]
+
+
+async def migrate(engine):
+    """Bring the database up to the latest version in MIGRATIONS."""
+    async with engine.begin() as conn:
+        await conn.execute(text("SELECT pg_advisory_xact_lock(hashtextextended(:key, 0))"), {"key": MIGRATION_LOCK})
+        await conn.execute(text("""
+            CREATE TABLE IF NOT EXISTS schema_migrations (
+                version INTEGER PRIMARY KEY,
+                name TEXT NOT NULL,
+                applied_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now()
+            )
+        """))
+
+    for version, name, steps in MIGRATIONS:
+        async with engine.begin() as conn:
+            await conn.execute(text("SELECT pg_advisory_xact_lock(hashtextextended(:key, 0))"), {"key": MIGRATION_LOCK})
+            applied = await conn.scalar(text("SELECT 1 FROM schema_migrations WHERE version = :version"), {"version": version})
+            if applied:
+                continue
+            for step in steps:
+                await conn.execute(text(step))
+            await conn.execute(
+                text("INSERT INTO schema_migrations (version, name) VALUES (:version, :name)"),
+                {"version": version, "name": name},
+            )
+            print(f"Applied migration {version}: {name}")
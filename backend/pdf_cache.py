@@ -0,0 +1,92 @@
+import asyncio
+import hashlib
+import json
+import os
+import tempfile
+
+from memory_cache import LRUCache
+
+
+def document_key(data, template_version):
+    """Content address of a rendered document: sha256 over the canonical JSON and the template version."""
+    payload = json.dumps([template_version, data], sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class PDFCache:
+    """Rendered PDFs by content key: hot bytes in memory, everything else on local disk.
+
+    The disk tier is bounded by `max_disk_bytes` and evicts least recently used files first,
+    using mtime (bumped on every hit) as the recency order.
+    """
+
+    def __init__(self, directory, max_disk_bytes, memory_entries=256, memory_bytes=64 * 1024 * 1024):
+        self.directory = directory
+        self.max_disk_bytes = max_disk_bytes
+        self.memory = LRUCache(memory_entries, max_bytes=memory_bytes)
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self, key):
+        return os.path.join(self.directory, f"{key}.pdf")
+
+    async def get(self, key):
+        pdf = self.memory.get(key)
+        if pdf is not None:
+            self.memory_hits += 1
+            return pdf
+        pdf = await asyncio.to_thread(self._read, key)
+        if pdf is not None:
+            self.disk_hits += 1
+            self.memory.set(key, pdf)
+            return pdf
+        self.misses += 1
+        return None
+
+    async def set(self, key, pdf):
+        self.memory.set(key, pdf)
+        await asyncio.to_thread(self._write, key, pdf)
+
+    def _read(self, key):
+        try:
+            with open(self.path(key), "rb") as f:
+                pdf = f.read()
+            os.utime(self.path(key))
+            return pdf
+        except FileNotFoundError:
+            return None
+
+    def _write(self, key, pdf):
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(pdf)
+        os.replace(tmp_path, self.path(key))
+        self._evict()
+
+    def _evict(self):
+        files = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".pdf"):
+                stat = entry.stat()
+                files.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= self.max_disk_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def stats(self):
+        return {
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hits": self.memory_hits + self.disk_hits,
+            "memory_entries": len(self.memory),
+            "memory_bytes": self.memory.size,
+        }
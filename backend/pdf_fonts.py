@@ -0,0 +1,29 @@
+import os
+from functools import lru_cache
+
+from fpdf import FPDF
+
+FONT_PATH = os.path.dirname(os.path.realpath(__file__)) + "/fonts/NotoSans-VariableFont_wdth,wght.ttf"
+
+
+@lru_cache(maxsize=None)
+def registered_fonts():
+    """NotoSans as fpdf registers it, loaded and parsed once per process."""
+    template = FPDF()
+    template.add_font("NotoSans", style="", fname=FONT_PATH, uni=True)
+    return template.fonts, template.font_files
+
+
+def new_document(*args, **kwargs):
+    """A fresh FPDF with NotoSans already registered.
+
+    The parsed metrics are shared between documents; the glyph subset and the font object
+    numbers fpdf fills in while writing a document are copied per document.
+    """
+    pdf = FPDF(*args, **kwargs)
+    fonts, font_files = registered_fonts()
+    for key, font in fonts.items():
+        pdf.fonts[key] = {**font, "subset": list(font["subset"])}
+    for key, font_file in font_files.items():
+        pdf.font_files[key] = dict(font_file)
+    return pdf
@@ -0,0 +1,100 @@
+import hashlib
+from datetime import datetime, timedelta, timezone
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from sqlalchemy import or_, select, update
+from sqlalchemy.dialects.postgresql import insert
+
+from schemas import JobPostings
+from singleflight import claim_lease
+
+TRACKING_PARAMS = {
+    "gclid", "fbclid", "msclkid", "dclid", "yclid", "mc_cid", "mc_eid", "_hsenc", "_hsmi",
+    "trk", "trkinfo", "trackingid", "refid", "ref", "referrer", "src_trk", "igshid",
+}
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def normalize_job_url(url):
+    """Canonical form of a posting URL: lowercased scheme/host, no default port, fragment or tracking params."""
+    url = url.strip()
+    parts = urlsplit(url)
+    if not parts.netloc:
+        # No scheme ("example.com/jobs/1"): read what comes first as the host, not the path.
+        parts = urlsplit("//" + url)
+    scheme = parts.scheme.lower() or "https"
+    host = (parts.hostname or "").lower()
+    if ":" in host:
+        host = f"[{host}]"
+    if parts.port and parts.port != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+    query = [
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith("utm_") and k.lower() not in TRACKING_PARAMS
+    ]
+    return urlunsplit((scheme, host, parts.path or "/", urlencode(sorted(query)), ""))
+
+
+def posting_id(canonical_url):
+    return hashlib.sha256(canonical_url.encode("utf-8")).hexdigest()
+
+
+async def load_posting(session, canonical_url):
+    return await session.scalar(select(JobPostings).where(JobPostings.posting_id == posting_id(canonical_url)))
+
+
+def is_fresh(posting, ttl):
+    """True if the posting was fetched or revalidated within the last `ttl` seconds."""
+    return posting.fetched_at is not None and posting.fetched_at > datetime.now(timezone.utc) - timedelta(seconds=ttl)
+
+
+async def claim_refresh(session, canonical_url, ttl, lease):
+    """Take the refresh lease on a missing or stale posting; None while it is fresh or leased elsewhere."""
+    stale = datetime.now(timezone.utc) - timedelta(seconds=ttl)
+    return await session.scalar(claim_lease(
+        JobPostings, JobPostings.posting_id, JobPostings.refreshing_until, lease,
+        or_(JobPostings.fetched_at.is_(None), JobPostings.fetched_at <= stale),
+        posting_id=posting_id(canonical_url), url=canonical_url,
+    ))
+
+
+async def release_refresh(session, posting):
+    """Give up a refresh lease early (the fetch failed) so the next request can try again."""
+    await session.execute(
+        update(JobPostings).where(JobPostings.posting_id == posting.posting_id).values(refreshing_until=None)
+    )
+
+
+async def save_posting(session, canonical_url, job_desc, job_req, etag=None, last_modified=None):
+    stmt = insert(JobPostings).values(
+        posting_id=posting_id(canonical_url),
+        url=canonical_url,
+        job_desc=job_desc,
+        job_req=job_req,
+        fetched_at=datetime.now(timezone.utc),
+        etag=etag,
+        last_modified=last_modified,
+        refreshing_until=None,
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[JobPostings.posting_id],
+        set_={
+            "job_desc": stmt.excluded.job_desc,
+            "job_req": stmt.excluded.job_req,
+            "fetched_at": stmt.excluded.fetched_at,
+            "etag": stmt.excluded.etag,
+            "last_modified": stmt.excluded.last_modified,
+            "refreshing_until": stmt.excluded.refreshing_until,
+        },
+    )
+    await session.execute(stmt)
+    return posting_id(canonical_url)
+
+
+async def touch_posting(session, posting):
+    """Mark a posting as revalidated (upstream answered 304 Not Modified)."""
+    await session.execute(
+        update(JobPostings)
+        .where(JobPostings.posting_id == posting.posting_id)
+        .values(fetched_at=datetime.now(timezone.utc), refreshing_until=None)
+    )
@@ -0,0 +1,74 @@
+"""Approximate, pdflatex-free rendering of the resume layout for quick draft previews."""
+import pdf_fonts
+
+# Letter paper with the half-inch margins of the LaTeX template, in mm.
+MARGIN = 12.7
+LINE = 4.6
+BULLET_INDENT = 5
+
+
+def new_document():
+    pdf = pdf_fonts.new_document(format="letter")
+    pdf.set_margins(MARGIN, MARGIN, MARGIN)
+    pdf.set_auto_page_break(auto=True, margin=MARGIN)
+    pdf.add_page()
+    return pdf
+
+
+def two_column_row(pdf, left, right, size):
+    pdf.set_font("NotoSans", size=size)
+    pdf.cell(w=0, h=LINE, txt=left)
+    pdf.set_x(MARGIN)
+    pdf.cell(w=0, h=LINE, txt=right, align="R", ln=1)
+
+
+def section_title(pdf, title):
+    pdf.ln(2)
+    pdf.set_font("NotoSans", size=12)
+    pdf.cell(w=0, h=6, txt=title.upper(), ln=1)
+    pdf.line(MARGIN, pdf.get_y(), pdf.w - MARGIN, pdf.get_y())
+    pdf.ln(1.5)
+
+
+def bullets(pdf, text):
+    pdf.set_font("NotoSans", size=9)
+    for line in text.split("\n"):
+        if line.strip():
+            pdf.set_x(MARGIN + BULLET_INDENT)
+            pdf.multi_cell(w=0, h=LINE, txt="•  " + line.strip())
+    pdf.ln(1)
+
+
+def render_preview(data):
+    """Lay out `data` like the LaTeX resume and return the PDF bytes."""
+    pdf = new_document()
+
+    details = data["personal_details"]
+    pdf.set_font("NotoSans", size=20)
+    pdf.cell(w=0, h=9, txt=f"{details['first_name']} {details['last_name']}", align="C", ln=1)
+    pdf.set_font("NotoSans", size=9)
+    contact = [details["phone"], details["email"], f"linkedin.com/{details['linkedin']}", f"github.com/{details['github']}"]
+    pdf.cell(w=0, h=LINE, txt="   |   ".join(str(value) for value in contact), align="C", ln=1)
+
+    section_title(pdf, "Education")
+    for edu in data["education"]:
+        two_column_row(pdf, str(edu["university"]), f"{edu['start_year']} - {edu['graduation_year']}", 10)
+        two_column_row(pdf, f"{edu['degree']} (CGPA: {edu['gpa']})", "", 9)
+        bullets(pdf, edu["description"])
+
+    section_title(pdf, "Experience")
+    for work in data["work_experience"]:
+        two_column_row(pdf, str(work["company"]), f"{work['start_year']} - {work['end_year']}", 10)
+        two_column_row(pdf, str(work["job_title"]), str(work["location"]), 9)
+        bullets(pdf, work["work_desc"])
+
+    section_title(pdf, "Projects")
+    for project in data["projects"]:
+        two_column_row(pdf, f"{project['project_name']} | {project['project_tech']}", "Project URL", 10)
+        bullets(pdf, project["project_desc"])
+
+    section_title(pdf, "Skills")
+    pdf.set_font("NotoSans", size=9)
+    pdf.multi_cell(w=0, h=LINE, txt=", ".join(data["skills"]["skills"]))
+
+    return pdf.output(dest="S").encode("latin-1")
@@ -0,0 +1,84 @@
+import asyncio
+import math
+import time
+from collections import deque
+
+
+class RenderQueueFull(Exception):
+    def __init__(self, retry_after):
+        super().__init__("Render queue is full")
+        self.retry_after = retry_after
+
+
+class RenderTimeout(Exception):
+    pass
+
+
+class RenderPool:
+    """Run TeX processes with at most `workers` at once and at most `max_queue` waiting.
+
+    Submissions past the queue bound fail fast with RenderQueueFull; a process that outlives
+    `timeout` seconds (or whose caller goes away) is killed.
+    """
+
+    def __init__(self, workers, max_queue, timeout):
+        self.workers = workers
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self.semaphore = asyncio.Semaphore(workers)
+        self.waiting = 0
+        self.running = 0
+        self.completed = 0
+        self.rejected = 0
+        self.timeouts = 0
+        self.durations = deque(maxlen=512)
+
+    async def run(self, *args, cwd=None, env=None):
+        if self.waiting >= self.max_queue:
+            self.rejected += 1
+            raise RenderQueueFull(self.retry_after())
+        self.waiting += 1
+        try:
+            await self.semaphore.acquire()
+        finally:
+            self.waiting -= 1
+
+        self.running += 1
+        started = time.monotonic()
+        process = None
+        try:
+            process = await asyncio.create_subprocess_exec(*args, cwd=cwd, env=env, stdin=asyncio.subprocess.DEVNULL)
+            await asyncio.wait_for(process.wait(), self.timeout)
+            return process.returncode
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            raise RenderTimeout(f"Render exceeded {self.timeout}s")
+        finally:
+            if process is not None and process.returncode is None:
+                process.kill()
+                await process.wait()
+            self.running -= 1
+            self.semaphore.release()
+            self.completed += 1
+            self.durations.append(time.monotonic() - started)
+
+    def average_duration(self):
+        return sum(self.durations) / len(self.durations) if self.durations else 1.0
+
+    def retry_after(self):
+        """Seconds until a slot is likely to free up, from the queue length and recent render times."""
+        return max(1, math.ceil(self.average_duration() * (self.waiting + self.running) / self.workers))
+
+    def stats(self):
+        durations = sorted(self.durations)
+        return {
+            "workers": self.workers,
+            "max_queue": self.max_queue,
+            "queue_depth": self.waiting,
+            "running": self.running,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "timeouts": self.timeouts,
+            "avg_render_seconds": round(self.average_duration(), 3) if durations else None,
+            "p95_render_seconds": round(durations[math.ceil(len(durations) * 0.95) - 1], 3) if durations else None,
+        }
@@ -1,62 +1,17 @@
-import subprocess
+import asyncio
+import hashlib
+import json
 import os
+import re
+import shutil
+import tempfile
+from string import Template
 
-async def generate_latex(data, rand_uuid):
-    first_name = data["personal_details"]["first_name"]
-    last_name = data["personal_details"]["last_name"]
-    email = data["personal_details"]["email"]
-    phone = data["personal_details"]["phone"]
-    linkedin = data["personal_details"]["linkedin"]
-    github = data["personal_details"]["github"]
-
-    # Extract education dynamically
-    education_list = []
-    for i, edu in enumerate(data["education"], start=1):
-        vars()[f"university_{i}"] = edu["university"]
-        vars()[f"degree_{i}"] = edu["degree"]
-        vars()[f"start_year_{i}"] = edu["start_year"]
-        vars()[f"graduation_year_{i}"] = edu["graduation_year"]
-        vars()[f"gpa_{i}"] = edu["gpa"]
-        vars()[f"description_{i}"] = edu["description"]
-        education_list.append(edu)
-
-    # Extract work experience dynamically
-    work_experience_list = []
-    for i, work in enumerate(data["work_experience"], start=1):
-        vars()[f"company_{i}"] = work["company"]
-        vars()[f"location_{i}"] = work["location"]
-        vars()[f"job_title_{i}"] = work["job_title"]
-        vars()[f"start_year_{i}"] = work["start_year"]
-        vars()[f"end_year_{i}"] = work["end_year"]
-        vars()[f"work_desc_{i}"] = work["work_desc"]
-        work_experience_list.append(work)
-
-    # Extract projects dynamically
-    projects_list = []
-    for i, proj in enumerate(data["projects"], start=1):
-        vars()[f"project_name_{i}"] = proj["project_name"]
-        vars()[f"project_tech_{i}"] = proj["project_tech"]
-        vars()[f"project_link_{i}"] = proj["project_link"]
-        vars()[f"project_desc_{i}"] = proj["project_desc"]
-        projects_list.append(proj)
-
-    # Extract skills
-    skills_list = data["skills"]["skills"]
-
-    # Print extracted values (for debugging purposes)
-    print(f"Name: {first_name} {last_name}")
-    print(f"Email: {email}")
-    print(f"Phone: {phone}")
-    print(f"LinkedIn: {linkedin}")
-    print(f"GitHub: {github}")
-    print("Education:", education_list)
-    print("Work Experience:", work_experience_list)
-    print("Projects:", projects_list)
-    print("Skills:", skills_list)
-    
-    # Extract personal details
-    # LaTeX template
-    latex_string = r"""
+from memory_cache import LRUCache
+from render_pool import RenderPool
+
+# Everything up to \endofdump is static and gets dumped into a precompiled pdflatex format.
+STATIC_PREAMBLE = r"""
 \documentclass[letterpaper,11pt]{article}
 
 \usepackage{fontawesome5}
@@ -67,11 +22,9 @@ async def generate_latex(data, rand_uuid):
 \usepackage[usenames,dvipsnames]{color}
 \usepackage{verbatim}
 \usepackage{enumitem}
-\usepackage[hidelinks]{hyperref}
 \usepackage{fancyhdr}
 \usepackage[english]{babel}
 \usepackage{tabularx}
-\input{glyphtounicode}
 
 % Custom font
 \usepackage[default]{lato}
@@ -89,8 +42,6 @@ async def generate_latex(data, rand_uuid):
 \addtolength{\topmargin}{-.5in}
 \addtolength{\textheight}{1.0in}
 
-\urlstyle{same}
-
 \raggedbottom
 \raggedright
 \setlength{\tabcolsep}{0in}
@@ -100,12 +51,8 @@ async def generate_latex(data, rand_uuid):
   \vspace{-4pt}\scshape\raggedright\large
 }{}{0em}{}[\color{black}\titlerule\vspace{-5pt}]
 
-% Ensure that generate pdf is machine readable/ATS parsable
-\pdfgentounicode=1
-
 %-------------------------%
 % Custom commands
-\begin{document}
 \newcommand{\resumeItem}[1]{
   \item\small{
     {#1 \vspace{-2pt}}
@@ -145,93 +92,271 @@ async def generate_latex(data, rand_uuid):
 
 \definecolor{Black}{RGB}{0, 0, 0}
 \newcommand{\seticon}[1]{\textcolor{Black}{\csname #1\endcsname}}
+"""
+
+# Loaded on every compile: hyperref and the glyph-to-unicode tables do not survive a format dump.
+DYNAMIC_PREAMBLE = r"""
+\usepackage[hidelinks]{hyperref}
+\urlstyle{same}
+\input{glyphtounicode}
+
+% Ensure that generate pdf is machine readable/ATS parsable
+\pdfgentounicode=1
+"""
+
+# Every render gets its own scratch directory, on tmpfs when the host has one.
+WORKSPACE_ROOT = os.getenv("RENDER_WORKSPACE_DIR") or ("/dev/shm" if os.access("/dev/shm", os.W_OK) else None)
+FORMAT_DIR = os.getenv("LATEX_FORMAT_DIR", os.path.dirname(os.path.realpath(__file__)) + "/latex-format")
+FORMAT_NAME = "resume-" + hashlib.sha256(STATIC_PREAMBLE.encode("utf-8")).hexdigest()[:12]
+# Part of every rendered-PDF cache key: bump the number whenever the body generate_latex emits changes.
+TEMPLATE_VERSION = f"3-{FORMAT_NAME}"
+
+# pdflatex is CPU bound: run one per core, queue a bounded number more and shed the rest.
+render_pool = RenderPool(
+    workers=int(os.getenv("RENDER_WORKERS", str(os.cpu_count() or 1))),
+    max_queue=int(os.getenv("RENDER_MAX_QUEUE", "32")),
+    timeout=float(os.getenv("RENDER_TIMEOUT", "30")),
+)
+
+format_lock = asyncio.Lock()
+format_ready = None
+
+async def ensure_format():
+    """Dump STATIC_PREAMBLE into FORMAT_DIR/FORMAT_NAME.fmt once; returns False if that is not possible."""
+    global format_ready
+    if format_ready is not None:
+        return format_ready
+    async with format_lock:
+        if format_ready is None:
+            format_ready = os.path.exists(f"{FORMAT_DIR}/{FORMAT_NAME}.fmt") or await build_format()
+    return format_ready
+
+async def build_format():
+    os.makedirs(FORMAT_DIR, exist_ok=True)
+    with tempfile.TemporaryDirectory() as build_dir:
+        with open(f"{build_dir}/{FORMAT_NAME}.tex", "w") as f:
+            f.write(STATIC_PREAMBLE + "\\csname endofdump\\endcsname\n\\begin{document}\n\\end{document}\n")
+        process = await asyncio.create_subprocess_exec(
+            "pdflatex", "-ini", "-interaction=nonstopmode", f"-jobname={FORMAT_NAME}",
+            "&pdflatex", "mylatexformat.ltx", f"{FORMAT_NAME}.tex",
+            cwd=build_dir,
+            stdout=asyncio.subprocess.DEVNULL,
+        )
+        await process.wait()
+        if process.returncode != 0 or not os.path.exists(f"{build_dir}/{FORMAT_NAME}.fmt"):
+            print(f"Could not build LaTeX format {FORMAT_NAME}; compiling resumes without it")
+            return False
+        shutil.move(f"{build_dir}/{FORMAT_NAME}.fmt", f"{FORMAT_DIR}/{FORMAT_NAME}.fmt")
+    return True
+
+async def run_pdflatex(tex_name, cwd):
+    """Compile with the precompiled preamble format when available, else cold."""
+    pdf_path = os.path.join(cwd, os.path.splitext(tex_name)[0] + ".pdf")
+    if await ensure_format():
+        # A trailing colon keeps the default format search path after FORMAT_DIR.
+        returncode = await render_pool.run("pdflatex", "--interaction=nonstopmode", f"-fmt={FORMAT_NAME}", tex_name,
+                                           cwd=cwd, env={**os.environ, "TEXFORMATS": f"{FORMAT_DIR}:"})
+        if returncode == 0 or os.path.exists(pdf_path):
+            return
+        # Most likely a format dumped by another TeX installation: stop using it and compile cold.
+        print(f"pdflatex failed with format {FORMAT_NAME} (exit {returncode}); discarding it and compiling without it")
+        discard_format()
+    returncode = await render_pool.run("pdflatex", "--interaction=nonstopmode", tex_name, cwd=cwd)
+    if returncode != 0 and not os.path.exists(pdf_path):
+        print(f"pdflatex failed (exit {returncode}) and produced no PDF")
+
+def discard_format():
+    """Compile cold for the rest of this process; the next process rebuilds the format."""
+    global format_ready
+    format_ready = False
+    try:
+        os.remove(f"{FORMAT_DIR}/{FORMAT_NAME}.fmt")
+    except FileNotFoundError:
+        pass
+
+DOCUMENT_START = STATIC_PREAMBLE + r"""
+\csname endofdump\endcsname
+""" + DYNAMIC_PREAMBLE + r"""
+\begin{document}
 
 %-------------------------------------------%
 %%%%%%  RESUME STARTS HERE  %%%%%
+"""
+
+DOCUMENT_END = r"""
+%-------------------------------------------%
+\end{document}
+"""
 
+# Section templates are parsed once here; `$$` is a literal dollar (TeX math mode).
+HEADER_TEMPLATE = Template(r"""
 %----------HEADING----------%
 \begin{center}
-    \textbf{\Huge \scshape """ + f"{first_name} {last_name}" + r"""} \\ \vspace{1pt}
-    \seticon{faPhone} \ \small """ + f"{phone}" + r""" \quad
-    \href{mailto:""" + f"{email}" + r"""}{\seticon{faEnvelope} \underline{""" + f"{email}" + r"""}} \quad
-    \href{https://www.linkedin.com/in/}{\seticon{faLinkedin} \underline{linkedin.com/""" + f"{linkedin}" + r"""}} \quad
-    \href{https://github.com/}{\seticon{faGithub} \underline{github.com/""" + f"{github}" + r"""}}
+    \textbf{\Huge \scshape ${first_name} ${last_name}} \\ \vspace{1pt}
+    \seticon{faPhone} \ \small ${phone} \quad
+    \href{mailto:${email_url}}{\seticon{faEnvelope} \underline{${email}}} \quad
+    \href{https://www.linkedin.com/in/}{\seticon{faLinkedin} \underline{linkedin.com/${linkedin}}} \quad
+    \href{https://github.com/}{\seticon{faGithub} \underline{github.com/${github}}}
 \end{center}
-"""
-    latex_string += r"""
-%-----------EDUCATION-----------%
-\section{Education}
+""")
+
+SECTION_TEMPLATE = Template(r"""
+%-----------${banner}-----------%
+\section{${title}}
 \resumeSubHeadingListStart
-"""
+${entries}\resumeSubHeadingListEnd
+""")
 
-    for edu in education_list:
-        latex_string += rf"""
+EDUCATION_TEMPLATE = Template(r"""
     \resumeSubheading
-    {{{edu["university"]}}}{{{edu["start_year"]} - {edu["graduation_year"]}}}
-    {{{edu["degree"]} (CGPA: {edu["gpa"]})}}{{}}
+    {${university}}{${start_year} - ${graduation_year}}
+    {${degree} (CGPA: ${gpa})}{}
     \resumeItemListStart
-    """
-        for desc in edu["description"].split("\n"):
-            latex_string += rf"     \resumeItem{{{desc}}}" + "\n"
-    
-        latex_string += r"""
-    \resumeItemListEnd
-    """
-
-    latex_string += r"\resumeSubHeadingListEnd"
-
-    latex_string += r"""
-%-----------EXPERIENCE-----------%
-\section{Experience}
-\resumeSubHeadingListStart
-"""
+${items}    \resumeItemListEnd
+""")
 
-    for work in work_experience_list:
-        latex_string += rf"""
+WORK_TEMPLATE = Template(r"""
     \resumeSubheading
-    {{{work["company"]}}}{{{work["start_year"]} -- {work["end_year"]}}}
-    {{{work["job_title"]}}}{{{work["location"]}}}
+    {${company}}{${start_year} -- ${end_year}}
+    {${job_title}}{${location}}
     \resumeItemListStart
-    """
-        for desc in work["work_desc"].split("\n"):
-            latex_string += rf"     \resumeItem{{{desc}}}" + "\n"
-    
-        latex_string += r"    \resumeItemListEnd " + "\n"
-
-    latex_string += r"\resumeSubHeadingListEnd"
-
- 
-    latex_string += r"""
-%-----------PROJECTS-----------%
-\section{Projects}
-\resumeSubHeadingListStart
-"""
+${items}    \resumeItemListEnd
+""")
 
-    for project in projects_list:
-        latex_string += rf"""
+PROJECT_TEMPLATE = Template(r"""
     \resumeProjectHeading
-    {{\textbf{{{project["project_name"]}}} $|$ \emph{{{project["project_tech"]}}}}}""" + r"{\emph{\href{" + f'{project["project_link"]}' + r"}{\seticon{faLink} \underline{Project URL}}}}" + rf""" 
+    {\textbf{${project_name}} $$|$$ \emph{${project_tech}}}{\emph{\href{${project_link}}{\seticon{faLink} \underline{Project URL}}}}
     \resumeItemListStart
-    """
-        for desc in project["project_desc"].split("\n"):
-            latex_string += rf"     \resumeItem{{{desc}}}" + "\n"
-    
-        latex_string += r"    \resumeItemListEnd " + "\n"
+${items}    \resumeItemListEnd
+""")
 
-    latex_string += r"""\resumeSubHeadingListEnd
+ITEM_TEMPLATE = Template(r"""     \resumeItem{${text}}
+""")
 
+SKILLS_TEMPLATE = Template(r"""
 %-----------SKILLS-----------%
 \section{ Skills}
     \begin{itemize}[leftmargin=0.15in, label={}]
-	\small{\item{""" + ', '.join(skills_list) + r"""}}
+	\small{\item{${skills}}}
     \end{itemize}
-
-%-------------------------------------------%
-\end{document}
-"""
-
-    with open(f"resume/{rand_uuid}.tex", "w") as f:
+""")
+
+LATEX_SPECIALS = {
+    "\\": r"\textbackslash{}",
+    "&": r"\&",
+    "%": r"\%",
+    "$": r"\$",
+    "#": r"\#",
+    "_": r"\_",
+    "{": r"\{",
+    "}": r"\}",
+    "~": r"\textasciitilde{}",
+    "^": r"\textasciicircum{}",
+}
+LATEX_SPECIALS_RE = re.compile("|".join(re.escape(char) for char in LATEX_SPECIALS))
+
+def latex_escape(value):
+    """Escape text so TeX typesets it literally."""
+    return LATEX_SPECIALS_RE.sub(lambda m: LATEX_SPECIALS[m.group()], str(value))
+
+def url_escape(value):
+    r"""Make a URL safe inside \href{...}: drop grouping characters, escape % and # and the & a tabular cell splits on."""
+    return re.sub(r"([%#&])", r"\\\1", re.sub(r"[\\{}]", "", str(value)))
+
+# Rendered section fragments by a hash of their input, so re-renders that change one
+# section (a tailored resume only rewrites bullets) reuse the others.
+fragment_cache = LRUCache(int(os.getenv("RESUME_FRAGMENT_CACHE_ENTRIES", "4096")))
+
+def cached_fragment(section, value, render):
+    payload = json.dumps([section, value], sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    key = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    fragment = fragment_cache.get(key)
+    if fragment is None:
+        fragment = render(value)
+        fragment_cache.set(key, fragment)
+    return fragment
+
+def render_items(text):
+    return "".join(ITEM_TEMPLATE.substitute(text=latex_escape(line)) for line in text.split("\n"))
+
+def render_header(details):
+    return HEADER_TEMPLATE.substitute(
+        first_name=latex_escape(details["first_name"]),
+        last_name=latex_escape(details["last_name"]),
+        phone=latex_escape(details["phone"]),
+        email=latex_escape(details["email"]),
+        email_url=url_escape(details["email"]),
+        linkedin=latex_escape(details["linkedin"]),
+        github=latex_escape(details["github"]),
+    )
+
+def render_education(education):
+    entries = "".join(EDUCATION_TEMPLATE.substitute(
+        university=latex_escape(edu["university"]),
+        start_year=latex_escape(edu["start_year"]),
+        graduation_year=latex_escape(edu["graduation_year"]),
+        degree=latex_escape(edu["degree"]),
+        gpa=latex_escape(edu["gpa"]),
+        items=render_items(edu["description"]),
+    ) for edu in education)
+    return SECTION_TEMPLATE.substitute(banner="EDUCATION", title="Education", entries=entries)
+
+def render_work_experience(work_experience):
+    entries = "".join(WORK_TEMPLATE.substitute(
+        company=latex_escape(work["company"]),
+        start_year=latex_escape(work["start_year"]),
+        end_year=latex_escape(work["end_year"]),
+        job_title=latex_escape(work["job_title"]),
+        location=latex_escape(work["location"]),
+        items=render_items(work["work_desc"]),
+    ) for work in work_experience)
+    return SECTION_TEMPLATE.substitute(banner="EXPERIENCE", title="Experience", entries=entries)
+
+def render_projects(projects):
+    entries = "".join(PROJECT_TEMPLATE.substitute(
+        project_name=latex_escape(project["project_name"]),
+        project_tech=latex_escape(project["project_tech"]),
+        project_link=url_escape(project["project_link"]),
+        items=render_items(project["project_desc"]),
+    ) for project in projects)
+    return SECTION_TEMPLATE.substitute(banner="PROJECTS", title="Projects", entries=entries)
+
+def render_skills(skills):
+    return SKILLS_TEMPLATE.substitute(skills=", ".join(latex_escape(skill) for skill in skills))
+
+def render_latex(data):
+    """Assemble the full .tex source for `data` from (cached) section fragments."""
+    return "".join([
+        DOCUMENT_START,
+        cached_fragment("header", data["personal_details"], render_header),
+        cached_fragment("education", data["education"], render_education),
+        cached_fragment("work_experience", data["work_experience"], render_work_experience),
+        cached_fragment("projects", data["projects"], render_projects),
+        cached_fragment("skills", data["skills"]["skills"], render_skills),
+        DOCUMENT_END,
+    ])
+
+async def generate_latex(data):
+    """Render the resume in `data` and return the PDF bytes, or None if pdflatex produced nothing."""
+    return await compile_pdf(render_latex(data))
+
+async def compile_pdf(latex_string):
+    workspace = tempfile.mkdtemp(prefix="resume-", dir=WORKSPACE_ROOT)
+    try:
+        await asyncio.to_thread(write_tex, f"{workspace}/resume.tex", latex_string)
+        await run_pdflatex("resume.tex", workspace)
+        return await asyncio.to_thread(read_pdf, f"{workspace}/resume.pdf")
+    finally:
+        shutil.rmtree(workspace, ignore_errors=True)
+
+def write_tex(path, latex_string):
+    with open(path, "w") as f:
         f.write(latex_string)
 
-    subprocess.call(["pdflatex", "--interaction=nonstopmode", f"{rand_uuid}.tex"], cwd=os.path.dirname(os.path.realpath(__file__))+"/resume")
+def read_pdf(path):
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
 
@@ -1,32 +1,16 @@
-from sqlalchemy import create_engine, Column, Integer, String, Text, Float
+from sqlalchemy import Column, Integer, String, Text, Float, DateTime, func
 from sqlalchemy.dialects.postgresql import ARRAY, JSON
-from sqlalchemy.engine import URL
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
-import os
-
-from dotenv import load_dotenv
-load_dotenv()
 
 
 Base = declarative_base()
-DATABASE_URL = URL.create(
-    drivername=os.getenv("PSQL_DRIVERNAME"),
-    username=os.getenv("PSQL_USERNAME"),
-    password=os.getenv("PSQL_PASSWORD"),
-    host=os.getenv("PSQL_HOST"),
-    port=os.getenv("PSQL_PORT"),
-    database=os.getenv("PSQL_DATABASE")
-)
-engine = create_engine(DATABASE_URL, echo=True)
-
-Session = sessionmaker(bind=engine)
-session = Session()
 
 class Login(Base):
     __tablename__ = "login"
     unique_id = Column("unique_id", String, primary_key=True)
     name = Column("name", String)
+    # Bumped by every write to the user's profile, jobs or questions; read endpoints use it as their ETag.
+    version = Column("version", Integer, nullable=False, server_default="0")
 
     def __init__(self, unique_id, name):
         self.unique_id = unique_id
@@ -67,8 +51,9 @@ class Education_Details(Base):
     graduation_year = Column("graduation_year", Integer)
     gpa = Column("gpa", Float)
     description = Column("description", Text)
+    position = Column("position", Integer)
 
-    def __init__(self, uid, unique_id, university, degree, start_year, graduation_year, gpa, description):
+    def __init__(self, uid, unique_id, university, degree, start_year, graduation_year, gpa, description, position=None):
         self.uid = uid
         self.unique_id = unique_id
         self.university = university
@@ -77,6 +62,7 @@ class Education_Details(Base):
         self.graduation_year = graduation_year
         self.gpa = gpa
         self.description = description
+        self.position = position
     
     def __repr__(self):
         return f"{self.unique_id}, {self.university}, {self.degree}, {self.start_year}, {self.graduation_year}, {self.gpa} {self.description}"
@@ -91,8 +77,9 @@ class Work_Details(Base):
     start_year = Column("start_year", Integer)
     end_year = Column("end_year", Integer)
     work_desc = Column("work_desc", Text)
+    position = Column("position", Integer)
 
-    def __init__(self, uid, unique_id, company, location, job_title, start_year, end_year, work_desc):
+    def __init__(self, uid, unique_id, company, location, job_title, start_year, end_year, work_desc, position=None):
         self.uid = uid
         self.unique_id = unique_id
         self.company = company
@@ -101,6 +88,7 @@ class Work_Details(Base):
         self.start_year = start_year
         self.end_year = end_year
         self.work_desc = work_desc
+        self.position = position
     
     def __repr__(self):
         return f"{self.unique_id}, {self.company}, {self.location}, {self.job_title}, {self.start_year}, {self.end_year}, {self.work_desc}"
@@ -113,14 +101,16 @@ class Project_Details(Base):
     project_tech = Column("project_tech", Text)
     project_link = Column("project_link", Text)
     project_desc = Column("project_desc", Text)
+    position = Column("position", Integer)
 
-    def __init__(self, uid, unique_id, project_name, project_tech, project_link, project_desc):
+    def __init__(self, uid, unique_id, project_name, project_tech, project_link, project_desc, position=None):
         self.uid = uid
         self.unique_id = unique_id
         self.project_name = project_name
         self.project_tech = project_tech
         self.project_link = project_link
         self.project_desc = project_desc
+        self.position = position
     
     def __repr__(self):
         return f"{self.unique_id}, {self.name}, {self.project_tech}, {self.project_link}, {self.project_desc}"
@@ -142,6 +132,7 @@ class UserJobs(Base):
     job_id = Column("job_id", String, primary_key=True)
     unique_id = Column("unique_id", String)
     job_name = Column("job_name", String)
+    created_at = Column("created_at", DateTime(timezone=True), nullable=False, server_default=func.now())
 
     def __init__(self, job_id, unique_id, job_name):
         self.job_id = job_id
@@ -159,18 +150,45 @@ class Jobs(Base):
     job_url = Column("job_url", Text)
     job_desc = Column("job_desc", Text)
     job_req = Column("job_req", Text)
+    posting_id = Column("posting_id", String)
 
-    def __init__(self, job_id, unique_id, job_name, job_url, job_desc, job_req):
+    def __init__(self, job_id, unique_id, job_name, job_url, job_desc, job_req, posting_id=None):
         self.job_id = job_id
         self.unique_id = unique_id
         self.job_name = job_name
         self.job_url = job_url
         self.job_desc = job_desc
         self.job_req = job_req
+        self.posting_id = posting_id
 
     def __repr__(self):
         return f"{self.job_id} {self.unique_id} {self.job_name} {self.job_url} {self.job_desc} {self.job_req}"
     
+class JobPostings(Base):
+    __tablename__ = "job_postings"
+    posting_id = Column("posting_id", String, primary_key=True)
+    url = Column("url", Text)
+    job_desc = Column("job_desc", Text)
+    job_req = Column("job_req", Text)
+    fetched_at = Column("fetched_at", DateTime(timezone=True))
+    etag = Column("etag", Text)
+    last_modified = Column("last_modified", Text)
+    # Set while one worker fetches and summarises the posting; others wait for its result.
+    refreshing_until = Column("refreshing_until", DateTime(timezone=True))
+
+    def __init__(self, posting_id, url, job_desc, job_req, fetched_at, etag=None, last_modified=None, refreshing_until=None):
+        self.posting_id = posting_id
+        self.url = url
+        self.job_desc = job_desc
+        self.job_req = job_req
+        self.fetched_at = fetched_at
+        self.etag = etag
+        self.last_modified = last_modified
+        self.refreshing_until = refreshing_until
+
+    def __repr__(self):
+        return f"{self.posting_id} {self.url} {self.fetched_at}"
+
 class JobQuestions(Base):
     __tablename__ = "job_questions"
     job_id = Column("job_id", String, primary_key=True)
@@ -179,14 +197,17 @@ class JobQuestions(Base):
     tech_questions = Column("tech_questions", Text)
     hr_questions = Column("hr_questions", Text)
     lc_questions = Column("lc_questions", JSON)
+    # Set while a find-questions search runs; empty categories count as failed once it has passed.
+    searching_until = Column("searching_until", DateTime(timezone=True))
 
-    def __init__(self, job_id, unique_id, job_name, tech_questions, hr_questions, lc_questions):
+    def __init__(self, job_id, unique_id, job_name, tech_questions, hr_questions, lc_questions, searching_until=None):
         self.job_id = job_id
         self.unique_id = unique_id
         self.job_name = job_name
         self.tech_questions = tech_questions
         self.hr_questions = hr_questions
         self.lc_questions = lc_questions
+        self.searching_until = searching_until
     
     def __repr__(self):
         return f"{self.job_id} {self.unique_id} {self.job_name} {self.tech_questions} {self.hr_questions} {self.lc_questions}"
@@ -196,13 +217,57 @@ class LeetCodeQuestions(Base):
     question = Column("question", String)
     url = Column("url", String, primary_key=True)
     desc = Column("desc", Text)
+    # Set while one worker asks the model for `desc`; others wait for its result.
+    generating_until = Column("generating_until", DateTime(timezone=True))
 
-    def __init__(self, question, url, desc):
+    def __init__(self, question, url, desc, generating_until=None):
         self.question = question
         self.url = url
         self.desc  = desc
+        self.generating_until = generating_until
     
     def __repr__(self):
         return f"{self.question} {self.url} {self.desc}"
 
-Base.metadata.create_all(bind=engine)
\ No newline at end of file
+class LLMCompletions(Base):
+    __tablename__ = "llm_completions"
+    cache_key = Column("cache_key", String, primary_key=True)
+    model = Column("model", String)
+    response = Column("response", Text)
+    created_at = Column("created_at", DateTime(timezone=True))
+
+    def __init__(self, cache_key, model, response, created_at):
+        self.cache_key = cache_key
+        self.model = model
+        self.response = response
+        self.created_at = created_at
+
+    def __repr__(self):
+        return f"{self.cache_key} {self.model} {self.created_at}"
+
+class TailorBatchJobs(Base):
+    __tablename__ = "tailor_batch_jobs"
+    task_id = Column("task_id", String, primary_key=True)
+    job_id = Column("job_id", String, primary_key=True)
+    unique_id = Column("unique_id", String)
+    job_name = Column("job_name", String)
+    status = Column("status", String, nullable=False)
+    # The tailored resume, so a PDF no longer in pdf_cache can be rendered again.
+    resume = Column("resume", JSON)
+    pdf_key = Column("pdf_key", String)
+    # A job still running once this has passed lost its worker and counts as failed.
+    tailoring_until = Column("tailoring_until", DateTime(timezone=True))
+    created_at = Column("created_at", DateTime(timezone=True), nullable=False, server_default=func.now())
+
+    def __init__(self, task_id, job_id, unique_id, job_name, status, tailoring_until, resume=None, pdf_key=None):
+        self.task_id = task_id
+        self.job_id = job_id
+        self.unique_id = unique_id
+        self.job_name = job_name
+        self.status = status
+        self.tailoring_until = tailoring_until
+        self.resume = resume
+        self.pdf_key = pdf_key
+
+    def __repr__(self):
+        return f"{self.task_id} {self.job_id} {self.job_name} {self.status}"
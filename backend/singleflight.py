@@ -0,0 +1,71 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import and_, or_
+from sqlalchemy.dialects.postgresql import insert
+
+# How often a worker that lost a claim checks whether the winner has finished.
+CLAIM_POLL_INTERVAL = 0.5
+
+
+class SingleFlight:
+    """Coalesce concurrent calls that share a key onto one in-flight call.
+
+    The first caller for a key starts `fn()`; everyone arriving while it runs awaits the same
+    result (or exception). A waiter being cancelled does not cancel the shared call.
+    """
+
+    def __init__(self):
+        self._calls = {}
+
+    async def do(self, key, fn):
+        future = self._calls.get(key)
+        if future is None:
+            future = asyncio.ensure_future(fn())
+            self._calls[key] = future
+            future.add_done_callback(lambda f: self._forget(key, f))
+        return await asyncio.shield(future)
+
+    def _forget(self, key, future):
+        if self._calls.get(key) is future:
+            del self._calls[key]
+        if not future.cancelled():
+            # Mark the exception retrieved even if every waiter went away.
+            future.exception()
+
+    def __len__(self):
+        return len(self._calls)
+
+
+async def claim_or_wait(claim, load_finished, poll_interval=CLAIM_POLL_INTERVAL):
+    """Cross-worker half of single-flight, holding no database connection while the work runs.
+
+    `claim()` tries to take a short lease on the work in its own quick transaction and returns the
+    claimed row, or None while the work is done or another worker's lease is still running.
+    `load_finished()` returns the finished result, or None. Polls both until one answers and
+    returns `(claimed, finished)`; a worker that dies mid-work is taken over when its lease ends.
+    """
+    while True:
+        claimed = await claim()
+        if claimed is not None:
+            return claimed, None
+        finished = await load_finished()
+        if finished is not None:
+            return None, finished
+        await asyncio.sleep(poll_interval)
+
+
+def claim_lease(table, key, column, ttl, *conditions, **values):
+    """Upsert `values` taking a `ttl`-second lease in `column`, unless a lease is live or `conditions` fail.
+
+    `key` is the unique column the row conflicts on. The statement returns the row when the lease
+    was taken and nothing otherwise; it is the `claim()` half of `claim_or_wait`.
+    """
+    now = datetime.now(timezone.utc)
+    stmt = insert(table).values(**values, **{column.key: now + timedelta(seconds=ttl)})
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[key],
+        set_={column.key: stmt.excluded[column.key]},
+        where=and_(or_(column.is_(None), column < now), *conditions),
+    )
+    return stmt.returning(table)
@@ -0,0 +1,92 @@
+import asyncio
+import os
+import sys
+import time
+
+# The backend is a flat set of modules run from its own directory (`uvicorn app:app`); fpdf's
+# cached font metrics under fonts/ also hold paths relative to it.
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+os.chdir(BACKEND_DIR)
+os.environ.setdefault("OPENAI_API_KEY", "test")
+
+import httpx
+import pytest
+
+from llm import LLMProvider
+from scratch_db import DATABASE_URL_HINT, scratch_schema
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+class FakeSession:
+    """Stands in for an AsyncSession: scalar() answers `result`, writes are accepted and dropped."""
+
+    def __init__(self, result=None):
+        self.result = result
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def scalar(self, *args, **kwargs):
+        return self.result
+
+    async def execute(self, *args, **kwargs):
+        pass
+
+    def add(self, obj):
+        pass
+
+    async def commit(self):
+        pass
+
+
+class SlowProvider(LLMProvider):
+    """Answers every completion after `delay` seconds of awaiting, like a slow model would."""
+
+    def __init__(self, delay, text="Dear Hiring Team,\nThank you.\nJane Doe"):
+        self.delay = delay
+        self.text = text
+        self.started = asyncio.Event()
+        self.started_at = None
+
+    async def complete(self, model, messages, max_tokens=None):
+        self.started_at = time.perf_counter()
+        self.started.set()
+        await asyncio.sleep(self.delay)
+        return self.text
+
+
+@pytest.fixture
+def backend():
+    import app
+    yield app
+    app.app.dependency_overrides.clear()
+
+
+@pytest.fixture
+async def client(backend):
+    # ASGITransport does not run the lifespan, so no migrations and no database are needed.
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=backend.app), base_url="http://test") as client:
+        yield client
+
+
+@pytest.fixture
+def test_database_url():
+    url = os.getenv("TEST_DATABASE_URL")
+    if not url:
+        pytest.skip(f"set TEST_DATABASE_URL to a scratch Postgres database, e.g. {DATABASE_URL_HINT}")
+    return url
+
+
+@pytest.fixture
+async def scratch_engine(test_database_url):
+    """An engine on a freshly migrated schema, with the pool limits database.py defaults to."""
+    async with scratch_schema(test_database_url, "test", pool_size=10, max_overflow=20, pool_timeout=30) as engine:
+        yield engine
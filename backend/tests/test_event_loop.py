@@ -0,0 +1,45 @@
+import asyncio
+import time
+
+import pytest
+
+from conftest import FakeSession, SlowProvider
+from database import get_session
+from llm_cache import CompletionCache
+from pdf_cache import PDFCache
+from schemas import Login
+
+SLOW_SECONDS = 1.0
+
+
+@pytest.mark.anyio
+async def test_slow_endpoint_does_not_delay_login(backend, client, monkeypatch, tmp_path):
+    provider = SlowProvider(SLOW_SECONDS)
+    monkeypatch.setattr(backend, "llm_provider", provider)
+    monkeypatch.setattr(backend, "completion_cache", CompletionCache(FakeSession))
+    monkeypatch.setattr(backend, "pdf_cache", PDFCache(str(tmp_path), max_disk_bytes=1024 * 1024))
+
+    async def login_session():
+        yield FakeSession(Login("jane@example.com", "Jane Doe"))
+
+    backend.app.dependency_overrides[get_session] = login_session
+
+    cover_letter = asyncio.create_task(client.post("/generate-cover-letter", json={
+        "resume": {"personal_details": {"first_name": "Jane"}},
+        "job_desc": "Backend engineer",
+    }))
+    await asyncio.wait_for(provider.started.wait(), SLOW_SECONDS)
+
+    # Timed from the start of the model call: a call that blocked the loop would already have
+    # used up the whole delay before /login got a chance to run.
+    response = await client.get("/login", params={"unique_id": "jane@example.com"})
+    elapsed = time.perf_counter() - provider.started_at
+
+    assert response.status_code == 200
+    assert response.json()["name"] == "Jane Doe"
+    assert elapsed < SLOW_SECONDS / 4
+    assert not cover_letter.done()
+
+    response = await cover_letter
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/pdf"
@@ -0,0 +1,61 @@
+from extract import JobPageExtractor, html_to_text
+
+LONG_PARAGRAPH = "We build the platform that runs every customer deployment. " * 10
+
+
+def test_stray_end_tag_does_not_end_main():
+    html = (
+        f"<html><body><nav>Jobs | Companies</nav><main><div><p>{LONG_PARAGRAPH}</p></span></div>"
+        "<h2>Requirements</h2><ul><li>5 years Python</li></ul></main><footer>About us</footer></body></html>"
+    )
+    text = html_to_text(html)
+    assert "5 years Python" in text
+    assert "Jobs | Companies" not in text
+    assert "About us" not in text
+
+
+def test_role_main_ends_at_its_own_end_tag():
+    html = (
+        f'<body><div class="layout"><div role="main"><div><p>{LONG_PARAGRAPH}</p></div>'
+        "<p>Apply by Friday</p></div><div>Similar jobs near you</div></div></body>"
+    )
+    text = html_to_text(html)
+    assert "Apply by Friday" in text
+    assert "Similar jobs near you" not in text
+
+
+def test_json_ld_job_posting_is_kept():
+    html = (
+        '<head><script type="application/ld+json">{"@type": "JobPosting", "title": "Backend Engineer",'
+        '"description": "<p>Own the <b>billing</b> service</p>"}</script></head><body><p>Short page</p></body>'
+    )
+    text = html_to_text(html)
+    assert '"title":"Backend Engineer"' in text
+    assert "Own the billing service" in text
+    assert "Short page" in text
+
+
+def test_chunked_feed_matches_whole_document():
+    html = (
+        f"<main><h1>Senior &amp; Staff Engineer</h1><p>{LONG_PARAGRAPH}</p>"
+        '<script>var tracking = "<p>not text</p>";</script><ul><li>Go</li><li>Postgres</li></ul></main>'
+    )
+    for size in (1, 7, 64):
+        extractor = JobPageExtractor()
+        for start in range(0, len(html), size):
+            extractor.feed(html[start:start + size])
+        extractor.close()
+        assert extractor.text() == html_to_text(html)
+
+
+def test_header_inside_main_is_content():
+    html = (
+        "<body><header>Acme careers | Sign in</header><main><article><header><h1>Senior Backend Engineer at Acme"
+        f"</h1></header><p>{LONG_PARAGRAPH}</p><aside>Salary: 150k</aside></article></main>"
+        "<footer>About us</footer></body>"
+    )
+    text = html_to_text(html)
+    assert "Senior Backend Engineer at Acme" in text
+    assert "Salary: 150k" in text
+    assert "Sign in" not in text
+    assert "About us" not in text
@@ -0,0 +1,55 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from conftest import FakeSession
+from fetcher import FetchError
+from schemas import JobPostings
+
+JOB_URL = "https://jobs.example.com/roles/42"
+
+
+@pytest.fixture
+def posting_store(backend, monkeypatch):
+    """The shared posting store holds `store["posting"]`; every refresh fails to fetch."""
+    store = {"posting": None}
+
+    async def load_posting(session, canonical_url):
+        return store["posting"]
+
+    async def refresh_posting(job_url, canonical_url):
+        raise FetchError("Timed out fetching the page")
+
+    async def get_job_uuid(session, unique_id, job_name):
+        return "job-1"
+
+    async def bump_version(session, unique_id):
+        pass
+
+    monkeypatch.setattr(backend, "Session", FakeSession)
+    monkeypatch.setattr(backend, "load_posting", load_posting)
+    monkeypatch.setattr(backend, "refresh_posting", refresh_posting)
+    monkeypatch.setattr(backend, "get_job_uuid", get_job_uuid)
+    monkeypatch.setattr(backend, "bump_version", bump_version)
+    return store
+
+
+async def fetch_description(client):
+    return await client.post("/fetch-description", json={"unique_id": "jane@example.com", "job_name": "Acme",
+                                                         "job_url": JOB_URL})
+
+
+@pytest.mark.anyio
+async def test_stale_posting_is_served_when_the_refresh_fails(client, posting_store):
+    fetched_at = datetime.now(timezone.utc) - timedelta(days=3)
+    posting_store["posting"] = JobPostings("posting-1", JOB_URL, "Build billing.", "Python.", fetched_at)
+    response = await fetch_description(client)
+    assert response.status_code == 200
+    assert response.json()["description"] == "Build billing."
+
+
+@pytest.mark.anyio
+async def test_refresh_failure_without_a_stored_posting_is_a_bad_gateway(client, posting_store):
+    response = await fetch_description(client)
+    assert response.status_code == 502
+    assert "Timed out" in response.json()["Error"]
@@ -0,0 +1,134 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from extract import JobPageExtractor
+from fetcher import FetchError, PageFetcher
+
+PAGE = "<html><body><main><h1>Backend Engineer</h1><p>Build the billing service.</p></main></body></html>"
+ETAG = '"v1"'
+LAST_MODIFIED = "Mon, 06 Oct 2025 10:00:00 GMT"
+SLOW_SECONDS = 2
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path == "/page":
+            if self.headers.get("If-None-Match") == ETAG:
+                self.send_response(304)
+                self.send_header("ETag", ETAG)
+                self.end_headers()
+                return
+            self.send_body(PAGE.encode("utf-8"), ETag=ETAG, **{"Last-Modified": LAST_MODIFIED})
+        elif self.path == "/moved":
+            self.redirect("/page")
+        elif self.path == "/loop":
+            self.redirect("/loop")
+        elif self.path == "/big":
+            self.send_body(b"<p>" + b"x" * (1024 * 1024) + b"</p>")
+        elif self.path == "/slow":
+            time.sleep(SLOW_SECONDS)
+            self.send_body(PAGE.encode("utf-8"))
+        else:
+            self.send_error(404)
+
+    def send_body(self, body, **headers):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def redirect(self, location):
+        self.send_response(302)
+        self.send_header("Location", location)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+async def fetcher():
+    fetcher = PageFetcher(connect_timeout=1, read_timeout=1, total_timeout=0.5, max_bytes=64 * 1024, max_redirects=3)
+    yield fetcher
+    await fetcher.aclose()
+
+
+@pytest.mark.anyio
+async def test_fetch_returns_body_and_validators(stub_server, fetcher):
+    page = await fetcher.fetch(f"{stub_server}/page")
+    assert page.status_code == 200
+    assert page.text == PAGE
+    assert page.size == len(PAGE)
+    assert page.etag == ETAG
+    assert page.last_modified == LAST_MODIFIED
+    assert not page.truncated
+
+
+@pytest.mark.anyio
+async def test_revalidation_with_etag_is_not_modified(stub_server, fetcher):
+    page = await fetcher.fetch(f"{stub_server}/page", etag=ETAG, last_modified=LAST_MODIFIED)
+    assert page.not_modified
+    assert page.text == ""
+
+
+@pytest.mark.anyio
+async def test_body_is_capped_at_max_bytes(stub_server, fetcher):
+    page = await fetcher.fetch(f"{stub_server}/big")
+    assert page.truncated
+    assert page.size == fetcher.max_bytes
+    assert len(page.text) == fetcher.max_bytes
+
+
+@pytest.mark.anyio
+async def test_redirect_is_followed(stub_server, fetcher):
+    page = await fetcher.fetch(f"{stub_server}/moved")
+    assert page.url == f"{stub_server}/page"
+    assert page.text == PAGE
+
+
+@pytest.mark.anyio
+async def test_redirect_loop_fails(stub_server, fetcher):
+    with pytest.raises(FetchError, match="Too many redirects"):
+        await fetcher.fetch(f"{stub_server}/loop")
+
+
+@pytest.mark.anyio
+async def test_slow_server_times_out(stub_server, fetcher):
+    started = time.perf_counter()
+    with pytest.raises(FetchError, match="Timed out"):
+        await fetcher.fetch(f"{stub_server}/slow")
+    assert time.perf_counter() - started < SLOW_SECONDS
+
+
+@pytest.mark.anyio
+async def test_error_status_fails(stub_server, fetcher):
+    with pytest.raises(FetchError, match="HTTP 404"):
+        await fetcher.fetch(f"{stub_server}/missing")
+
+
+@pytest.mark.anyio
+async def test_sink_receives_the_body_instead_of_text(stub_server, fetcher):
+    extractor = JobPageExtractor()
+    page = await fetcher.fetch(f"{stub_server}/page", sink=extractor)
+    extractor.close()
+    assert page.text == ""
+    assert page.size == len(PAGE)
+    assert extractor.text() == "Backend Engineer\nBuild the billing service."
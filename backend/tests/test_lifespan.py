@@ -0,0 +1,30 @@
+import pytest
+
+
+class Closeable:
+    def __init__(self):
+        self.closed = False
+
+    async def aclose(self):
+        self.closed = True
+
+    async def dispose(self):
+        self.closed = True
+
+
+@pytest.mark.anyio
+async def test_startup_succeeds_when_the_tokenizer_cannot_load(backend, monkeypatch):
+    async def migrate(engine):
+        pass
+
+    def get_encoding(*args):
+        raise ConnectionError("no network to download the BPE file")
+
+    monkeypatch.setattr(backend, "migrate", migrate)
+    monkeypatch.setattr(backend.tokenizer, "get_encoding", get_encoding)
+    for name in ("page_fetcher", "llm_provider", "engine"):
+        monkeypatch.setattr(backend, name, Closeable())
+
+    async with backend.lifespan(backend.app):
+        pass
+    assert backend.page_fetcher.closed and backend.engine.closed
@@ -0,0 +1,63 @@
+import json
+
+import pytest
+
+from database import get_session
+
+PROFILE = {"personal_details": {"first_name": "Jane"}, "education": [], "work_experience": [], "projects": [],
+           "skills": None}
+
+
+class ProfileResult:
+    def __init__(self, row):
+        self.row = row
+
+    def one(self):
+        return self.row
+
+
+class ProfileSession:
+    """Answers every statement with the user's version and profile, counting the round trips."""
+
+    def __init__(self, version):
+        self.version = version
+        self.statements = 0
+
+    async def execute(self, *args, **kwargs):
+        self.statements += 1
+        return ProfileResult((self.version, json.dumps(PROFILE)))
+
+    async def scalar(self, *args, **kwargs):
+        self.statements += 1
+        return self.version
+
+
+@pytest.fixture
+def session(backend):
+    session = ProfileSession(version=7)
+
+    async def request_session():
+        yield session
+
+    backend.app.dependency_overrides[get_session] = request_session
+    return session
+
+
+@pytest.mark.anyio
+async def test_load_details_is_one_round_trip(client, session):
+    response = await client.get("/load-details", params={"unique_id": "jane@example.com"})
+
+    assert response.status_code == 200
+    assert response.json() == PROFILE
+    assert response.headers["ETag"] == '"7"'
+    assert session.statements == 1
+
+
+@pytest.mark.anyio
+async def test_load_details_not_modified_is_one_round_trip(client, session):
+    response = await client.get("/load-details", params={"unique_id": "jane@example.com"},
+                                headers={"If-None-Match": '"7"'})
+
+    assert response.status_code == 304
+    assert response.headers["ETag"] == '"7"'
+    assert session.statements == 1
@@ -0,0 +1,62 @@
+import asyncio
+import json
+import uuid
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from database import get_session
+from schemas import Education_Details, Login, Personal_Details, Project_Details, Skills, Work_Details
+
+PARALLEL_REQUESTS = 300
+
+
+@pytest.fixture
+def sessions(scratch_engine):
+    return async_sessionmaker(bind=scratch_engine, expire_on_commit=False)
+
+
+@pytest.fixture
+async def profile(sessions):
+    unique_id = f"load-test-{uuid.uuid4()}@example.com"
+    rows = [
+        Login(unique_id, "Load Test"),
+        Personal_Details(unique_id, "Load", "Test", unique_id, "555-0100", "load-test", "load-test"),
+        Skills(unique_id, ["Python", "Postgres"]),
+    ]
+    for position in range(3):
+        rows += [
+            Education_Details(str(uuid.uuid4()), unique_id, f"University {position}", "BSc", 2015, 2019, 3.8,
+                              "Studied things\nBuilt things", position),
+            Work_Details(str(uuid.uuid4()), unique_id, f"Company {position}", "Remote", "Engineer", 2019, 2024,
+                         "Shipped features\nFixed bugs", position),
+            Project_Details(str(uuid.uuid4()), unique_id, f"Project {position}", "Python", "https://example.com",
+                            "Wrote code", position),
+        ]
+    async with sessions() as session:
+        session.add_all(rows)
+        await session.commit()
+    return unique_id
+
+
+@pytest.mark.anyio
+async def test_parallel_load_details(backend, client, scratch_engine, sessions, profile):
+    async def request_session():
+        async with sessions() as session:
+            yield session
+
+    backend.app.dependency_overrides[get_session] = request_session
+
+    responses = await asyncio.gather(*[
+        client.get("/load-details", params={"unique_id": profile}) for _ in range(PARALLEL_REQUESTS)
+    ])
+
+    assert [response.status_code for response in responses] == [200] * PARALLEL_REQUESTS
+    bodies = {response.content for response in responses}
+    assert len(bodies) == 1
+    loaded = json.loads(bodies.pop())
+    assert loaded["personal_details"]["first_name"] == "Load"
+    assert [entry["company"] for entry in loaded["work_experience"]] == ["Company 0", "Company 1", "Company 2"]
+    assert len({response.headers["ETag"] for response in responses}) == 1
+    # Every per-request session went back to the pool.
+    assert scratch_engine.pool.checkedout() == 0
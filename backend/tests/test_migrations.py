@@ -0,0 +1,23 @@
+import pytest
+from sqlalchemy import inspect
+
+from migrations import migrate
+from schemas import Base
+from scratch_db import scratch_schema
+
+
+def table_columns(conn):
+    inspector = inspect(conn)
+    return {table: {column["name"] for column in inspector.get_columns(table)} for table in inspector.get_table_names()}
+
+
+@pytest.mark.anyio
+async def test_migrations_build_the_schema_the_models_expect(test_database_url):
+    async with scratch_schema(test_database_url, "migration_test", migrated=False) as engine:
+        await migrate(engine)
+        # Running again is a no-op.
+        await migrate(engine)
+        async with engine.connect() as conn:
+            columns = await conn.run_sync(table_columns)
+    for table in Base.metadata.sorted_tables:
+        assert columns.get(table.name) == {column.name for column in table.columns}, table.name
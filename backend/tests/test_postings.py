@@ -0,0 +1,16 @@
+import pytest
+
+from postings import normalize_job_url
+
+
+@pytest.mark.parametrize("url, expected", [
+    ("HTTPS://Jobs.Example.com:443/roles/42?utm_source=x&b=2&a=1#apply", "https://jobs.example.com/roles/42?a=1&b=2"),
+    ("http://example.com", "http://example.com/"),
+    ("https://example.com:8443/a?gclid=1", "https://example.com:8443/a"),
+    ("x.com/jobs/1", "https://x.com/jobs/1"),
+    ("  careers.example.com:8080/jobs?id=7 ", "https://careers.example.com:8080/jobs?id=7"),
+    ("http://[::1]:8080/a", "http://[::1]:8080/a"),
+    ("https://[2001:DB8::1]:443/jobs", "https://[2001:db8::1]/jobs"),
+])
+def test_normalize_job_url(url, expected):
+    assert normalize_job_url(url) == expected
@@ -0,0 +1,46 @@
+import os
+import stat
+
+import pytest
+
+import resume
+
+# Stands in for pdflatex: a format argument fails like a format from another TeX install would.
+FAKE_PDFLATEX = """#!/bin/sh
+for arg in "$@"; do
+    case "$arg" in
+        -fmt=*) echo "Fatal format file error; I'm stymied" >&2; exit 1 ;;
+    esac
+done
+for arg in "$@"; do tex="$arg"; done
+printf '%%PDF-fake' > "${tex%.tex}.pdf"
+"""
+
+
+@pytest.fixture
+def fake_pdflatex(tmp_path, monkeypatch):
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    script = bin_dir / "pdflatex"
+    script.write_text(FAKE_PDFLATEX)
+    script.chmod(script.stat().st_mode | stat.S_IEXEC)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+
+
+@pytest.mark.anyio
+async def test_unusable_format_falls_back_to_a_cold_compile(tmp_path, monkeypatch, fake_pdflatex):
+    format_dir = tmp_path / "latex-format"
+    format_dir.mkdir()
+    stale = format_dir / f"{resume.FORMAT_NAME}.fmt"
+    stale.write_bytes(b"dumped by another TeX Live")
+    monkeypatch.setattr(resume, "FORMAT_DIR", str(format_dir))
+    monkeypatch.setattr(resume, "format_ready", None)
+    monkeypatch.setattr(resume, "WORKSPACE_ROOT", str(tmp_path))
+
+    assert await resume.compile_pdf("\\documentclass{article}") == b"%PDF-fake"
+    assert not stale.exists()
+    assert resume.format_ready is False
+
+
+def test_url_escape_keeps_tabular_cells_intact():
+    assert resume.url_escape("https://example.com/p?a=1&b=50%#top") == r"https://example.com/p?a=1\&b=50\%\#top"
@@ -0,0 +1,75 @@
+import asyncio
+
+import pytest
+
+from singleflight import SingleFlight, claim_or_wait
+
+
+@pytest.mark.anyio
+async def test_concurrent_calls_share_one_flight():
+    flights = SingleFlight()
+    calls = 0
+
+    async def work():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return "result"
+
+    results = await asyncio.gather(*[flights.do("key", work) for _ in range(10)])
+    assert results == ["result"] * 10
+    assert calls == 1
+    assert len(flights) == 0
+
+
+@pytest.mark.anyio
+async def test_claim_or_wait_runs_the_work_once_and_hands_losers_the_result():
+    # Stands in for a row with a lease column, shared by several workers.
+    row = {"leased": False, "result": None}
+    runs = 0
+
+    async def claim():
+        if row["leased"] or row["result"] is not None:
+            return None
+        row["leased"] = True
+        return row
+
+    async def load_finished():
+        return row["result"]
+
+    async def worker():
+        nonlocal runs
+        claimed, finished = await claim_or_wait(claim, load_finished, poll_interval=0.01)
+        if finished is not None:
+            return finished
+        runs += 1
+        await asyncio.sleep(0.05)
+        claimed.update(result="summary", leased=False)
+        return claimed["result"]
+
+    results = await asyncio.gather(*[worker() for _ in range(5)])
+    assert results == ["summary"] * 5
+    assert runs == 1
+
+
+@pytest.mark.anyio
+async def test_claim_or_wait_takes_over_a_released_lease():
+    row = {"leased": True, "result": None}
+
+    async def claim():
+        if row["leased"]:
+            return None
+        row["leased"] = True
+        return row
+
+    async def load_finished():
+        return row["result"]
+
+    waiter = asyncio.create_task(claim_or_wait(claim, load_finished, poll_interval=0.01))
+    await asyncio.sleep(0.05)
+    assert not waiter.done()
+    # The holder failed and released its lease without a result.
+    row["leased"] = False
+    claimed, finished = await asyncio.wait_for(waiter, 1)
+    assert claimed is row
+    assert finished is None
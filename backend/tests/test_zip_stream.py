@@ -0,0 +1,34 @@
+import io
+import zipfile
+
+import pytest
+
+from zip_stream import safe_entry_name, stream_zip
+
+
+@pytest.mark.parametrize("name, expected", [
+    ("Backend Engineer", "Backend Engineer"),
+    ("../../etc/passwd", "etc_passwd"),
+    ("C:\\Windows\\system32", "C_Windows_system32"),
+    ("..", "_"),
+    ("Ingénieur (Paris)", "Ingénieur (Paris)"),
+    ("tab\there\nnewline", "tab_here_newline"),
+])
+def test_safe_entry_name(name, expected):
+    assert safe_entry_name(name) == expected
+
+
+def test_safe_entry_name_is_bounded():
+    assert len(safe_entry_name("x" * 1000)) == 100
+
+
+@pytest.mark.anyio
+async def test_stream_zip_round_trips():
+    async def entries():
+        yield "resume-a.pdf", b"%PDF-a"
+        yield "resume-b.pdf", b"%PDF-b"
+
+    archive = b"".join([chunk async for chunk in stream_zip(entries())])
+    with zipfile.ZipFile(io.BytesIO(archive)) as zf:
+        assert zf.namelist() == ["resume-a.pdf", "resume-b.pdf"]
+        assert zf.read("resume-b.pdf") == b"%PDF-b"
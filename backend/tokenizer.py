@@ -0,0 +1,43 @@
+import functools
+
+import tiktoken
+
+DEFAULT_MODEL = "gpt-4o-mini"
+# Characters to encode per wanted token on the first pre-cut attempt; doubled until enough.
+CHARS_PER_TOKEN_GUESS = 6
+# Extra tokens required past the limit so the token boundary at the pre-cut cannot matter.
+PRECUT_MARGIN = 64
+
+
+@functools.lru_cache(maxsize=None)
+def get_encoding(model=DEFAULT_MODEL):
+    """Load (once per process) the tiktoken encoder for a model."""
+    return tiktoken.encoding_for_model(model)
+
+
+def count_tokens(text, model=DEFAULT_MODEL):
+    return len(get_encoding(model).encode_ordinary(text))
+
+
+def fits(text, max_tokens):
+    """Cheap check that `text` is under `max_tokens` without encoding: a token never covers less than one byte."""
+    return len(text) * 4 <= max_tokens or len(text.encode("utf-8")) <= max_tokens
+
+
+def truncate(text, max_tokens, model=DEFAULT_MODEL):
+    """Return the longest prefix of `text` that encodes to at most `max_tokens` tokens."""
+    if fits(text, max_tokens):
+        return text
+
+    enc = get_encoding(model)
+    chars = max_tokens * CHARS_PER_TOKEN_GUESS
+    while chars < len(text):
+        tokens = enc.encode_ordinary(text[:chars])
+        if len(tokens) >= max_tokens + PRECUT_MARGIN:
+            return enc.decode(tokens[:max_tokens])
+        chars *= 2
+
+    tokens = enc.encode_ordinary(text)
+    if len(tokens) <= max_tokens:
+        return text
+    return enc.decode(tokens[:max_tokens])
@@ -0,0 +1,42 @@
+import io
+import re
+import zipfile
+
+# Anything but letters, digits and a few punctuation marks, including path separators and control characters.
+UNSAFE_NAME_CHARS = re.compile(r"[^\w.() -]+")
+
+
+def safe_entry_name(name, max_length=100):
+    """`name` as a single harmless path component for an archive entry: no separators, no leading dots."""
+    name = UNSAFE_NAME_CHARS.sub("_", str(name)).strip(" ._")
+    return name[:max_length] or "_"
+
+
+class ZipBuffer(io.RawIOBase):
+    """Unseekable sink for zipfile: everything written since the last drain() is handed out in one piece."""
+
+    def __init__(self):
+        self.pending = bytearray()
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.pending += data
+        return len(data)
+
+    def drain(self):
+        data = bytes(self.pending)
+        self.pending.clear()
+        return data
+
+
+async def stream_zip(entries):
+    """Yield a ZIP archive chunk by chunk as `entries`, an async iterator of (name, bytes), produces files."""
+    buffer = ZipBuffer()
+    # PDFs are already compressed, so store them as-is.
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_STORED) as archive:
+        async for name, data in entries:
+            archive.writestr(name, data)
+            yield buffer.drain()
+    yield buffer.drain()
@@ -1,6 +1,8 @@
 import streamlit as st
 import requests
+from http_cache import cached_get
 import os
+import base64
 from dotenv import load_dotenv
 import asyncio
 from httpx_oauth.clients.google import GoogleOAuth2
@@ -111,7 +113,7 @@ def main():
                     )                
             else:
                 st.session_state.user_name = response_json.get("name", "User")
-                response = requests.get("http://backend:8000/load-details",
+                response = cached_get("http://backend:8000/load-details",
                                     params={"unique_id": st.session_state.user_email})
                 response_json = response.json()
                 if response_json.get("personal_details") == None:
@@ -235,15 +237,20 @@ def main():
                 data['work_experience'] = st.session_state['work_experience']
                 data['projects'] = st.session_state['projects']
                 data['skills'] = st.session_state['skills']
-                requests.post("http://backend:8000/update-details",
+                response = requests.post("http://backend:8000/update-details",
                     json={"unique_id": st.session_state.user_email, "content": data},
                 )
+                # Remember the ids assigned to new entries so the next save updates them in place
+                if response.status_code == 200:
+                    for key, uids in response.json().get("uids", {}).items():
+                        for entry, uid in zip(st.session_state[key], uids):
+                            entry["uid"] = uid
                             
             # Generate Resume
  
             side_col1, side_col2 = st.sidebar.columns([0.55, 0.45])
             if side_col1.button("Generate Resume", type="secondary", key="generate"):
-                response = requests.get("http://backend:8000/load-details",
+                response = cached_get("http://backend:8000/load-details",
                                     params={"unique_id": st.session_state.user_email})
                 response_json = dict(response.json())
                 data = {}
@@ -267,6 +274,23 @@ def main():
                     os.remove(f"resume/resume_{file_name}.pdf")
                 else:
                     side_col2.error("Failed to generate resume.")
+
+            # Quick draft of the layout from the unsaved form state, without a LaTeX compile
+            if st.sidebar.button("Preview Resume", type="secondary", key="preview"):
+                data = {}
+                data['personal_details'] = st.session_state['personal_details']
+                data['education'] = st.session_state['education']
+                data['work_experience'] = st.session_state['work_experience']
+                data['projects'] = st.session_state['projects']
+                data['skills'] = {"skills": st.session_state['skills']}
+                response = requests.post("http://backend:8000/generate-resume",
+                            json={"data": data, "preview": True}
+                )
+                if response.status_code == 200:
+                    encoded = base64.b64encode(response.content).decode("utf-8")
+                    st.markdown(f'''<iframe src="data:application/pdf;base64,{encoded}" width="100%" height="900" type="application/pdf"></iframe>''', unsafe_allow_html=True)
+                else:
+                    st.sidebar.error("Failed to preview resume.")
                 
             st.sidebar.divider()
 
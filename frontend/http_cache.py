@@ -0,0 +1,22 @@
+import json
+
+import requests
+import streamlit as st
+
+
+def cached_get(url, **kwargs):
+    """requests.get that keeps the last response per session and revalidates it with If-None-Match.
+
+    When the backend answers 304, the stored response is returned instead, so callers can keep
+    using .status_code and .json() as before.
+    """
+    cache = st.session_state.setdefault("http_cache", {})
+    key = url + json.dumps([kwargs.get("params"), kwargs.get("json")], sort_keys=True)
+    cached = cache.get(key)
+    headers = {"If-None-Match": cached.headers["ETag"]} if cached is not None else {}
+    response = requests.get(url, headers=headers, **kwargs)
+    if response.status_code == 304 and cached is not None:
+        return cached
+    if response.status_code == 200 and "ETag" in response.headers:
+        cache[key] = response
+    return response
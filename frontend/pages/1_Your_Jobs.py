@@ -1,13 +1,19 @@
 import streamlit as st
 import asyncio
 import os
+import time
 import requests
+from http_cache import cached_get
 import glob
+import io
+import zipfile
 from openai import OpenAI
 import json
 
 main_page = __import__("Home_Page")
 API_BASE = "http://backend:8000"
+JOBS_PAGE_SIZE = 50
+JOB_SORTS = {"Newest first": "newest", "Oldest first": "oldest", "Name": "name"}
 
 os.makedirs("resume/", exist_ok=True)
 os.makedirs("cover-letter/", exist_ok=True)
@@ -17,28 +23,118 @@ openai_client = OpenAI(
 
 # --- Functions for API calls ---
 
-def fetch_tabs_from_api():
-    response = requests.get(f"{API_BASE}/load-jobs", params={"unique_id": st.session_state.user_email})
+def fetch_tabs_from_api(after=None):
+    """One page of job names in the chosen order; remembers their ids and the cursor of the next page."""
+    response = cached_get(f"{API_BASE}/load-jobs", params={
+        "unique_id": st.session_state.user_email,
+        "sort": JOB_SORTS[st.session_state.get("job_sort", "Newest first")],
+        "limit": JOBS_PAGE_SIZE,
+        "after": after
+    })
     response_json = response.json()
-    print(response_json)
+    job_ids = dict(zip(response_json['jobs'], response_json.get('job_ids', [])))
+    if after is None:
+        st.session_state.job_ids = job_ids
+    else:
+        st.session_state.job_ids.update(job_ids)
+    st.session_state.jobs_cursor = response_json.get('next_cursor')
     return response_json['jobs']
 
 def add_tab_to_api(tab_name):
-    requests.post(f"{API_BASE}/add-job", json={"unique_id": st.session_state.user_email, "job_name": tab_name})
+    response = requests.post(f"{API_BASE}/add-job", json={"unique_id": st.session_state.user_email, "job_name": tab_name})
+    return response.status_code == 200
 
 def delete_tab_from_api(tab_name):
     requests.post(f"{API_BASE}/remove-job", json={"unique_id": st.session_state.user_email, "job_name": tab_name})
 
-def get_job_info_by_name(tab_name):
-    response = requests.get(f"{API_BASE}/get-job-details", json={"unique_id": st.session_state.user_email, "job_name": tab_name})
-    data = response.json()
-    return data.get("job_url", ""), data.get("description", ""), data.get("requirements", "")
+def fetch_job_bundle(job_name):
+    """Details, questions and id of the job being viewed from one request, keyed by job name."""
+    response = cached_get(f"{API_BASE}/job-bundle", params={"unique_id": st.session_state.user_email,
+                                                            "fields": "details,questions",
+                                                            "job_name": job_name})
+    if response.status_code != 200:
+        return {}
+    return {job["job_name"]: job for job in response.json()["jobs"]}
+
+def get_job_info_by_name(bundle, tab_name):
+    data = bundle.get(tab_name, {})
+    return data.get("job_url") or "", data.get("description") or "", data.get("requirements") or ""
 
 def fetch_description_by_url(tab_name, job_url):
     response = requests.post(f"{API_BASE}/fetch-description", json={"unique_id": st.session_state.user_email, "job_name": tab_name, "job_url": job_url})
     data = response.json()
     return data.get("description", ""), data.get("requirements", "")
 
+def tailored_resume_path(job_name, job_uuid):
+    return f"./resume/resume-{job_name}-{job_uuid}.pdf"
+
+def get_batch_progress():
+    """Progress of the running batch tailoring task; saves the resumes from its ZIP once it is done."""
+    response = requests.get(f"{API_BASE}/tailor-resumes/{st.session_state.tailor_task}")
+    if response.status_code == 404:
+        del st.session_state.tailor_task
+        st.warning("The batch of tailored resumes expired before it was saved. Please generate it again.")
+        return None
+    if response.status_code != 200:
+        st.warning("Could not check on the tailored resumes, retrying.")
+        return {"jobs": [], "done": 0, "total": 0, "isDone": False}
+    response_json = response.json()
+    if response_json["isDone"]:
+        archive_response = requests.get(f"{API_BASE}/tailor-resumes/{st.session_state.tailor_task}/zip")
+        if archive_response.status_code != 200:
+            st.warning("Could not download the tailored resumes, retrying.")
+            return {**response_json, "isDone": False}
+        # Entry names are sanitised by the backend; save each one where its job's tab looks for it.
+        paths = {job["file_name"]: tailored_resume_path(job["job_name"], job["job_id"]) for job in response_json["jobs"]}
+        saved = set()
+        with zipfile.ZipFile(io.BytesIO(archive_response.content)) as archive:
+            for name in archive.namelist():
+                if name in paths:
+                    with open(paths[name], "wb") as f:
+                        f.write(archive.read(name))
+                    saved.add(name)
+        for job in response_json["jobs"]:
+            if job["status"] == "done" and job["file_name"] not in saved:
+                job["status"] = "failed"
+        del st.session_state.tailor_task
+    return response_json
+
+def get_questions_progress(bundle, job_name):
+    """Questions saved so far for a job, plus whether a find-questions task is still running."""
+    task_key = f"questions_task_{job_name}"
+    if task_key in st.session_state:
+        response = requests.get(f"{API_BASE}/find-questions/{st.session_state[task_key]}")
+        if response.status_code == 200:
+            response_json = response.json()
+            if response_json["isDone"]:
+                del st.session_state[task_key]
+            return response_json, not response_json["isDone"]
+        del st.session_state[task_key]
+    return bundle.get(job_name, {}), False
+
+def render_questions(coll_1, coll_2, job_name, response_json):
+    if response_json.get("technical_questions"):
+        with coll_1.expander("Technical Questions"):
+            st.markdown(response_json["technical_questions"])
+    if response_json.get("hr_questions"):
+        with coll_1.expander("HR Questions"):
+            st.markdown(response_json["hr_questions"])
+
+    if response_json.get("leetcode_questions"):
+        coll_2.subheader("DSA Questions")
+        with coll_2.container():
+            questions = response_json["leetcode_questions"]
+            for q in questions:
+                for title, url in q.items():
+                    with st.expander(title):
+                        st.markdown(url)
+                        if st.button(f"🔍 Show Tips to solve this question", key=f"{job_name}_{title}_desc_button"):
+                            with st.spinner("Trying to solve the problem..."):
+                                lc_response = requests.get("http://backend:8000/get-leetcode-description",
+                                                        json={"question": title, "url": url})
+                                lc_response_json = lc_response.json()
+                                st.markdown(lc_response_json['desc'])
+
 
 
 if st.session_state.user_email and st.session_state.user_name:
@@ -46,6 +142,7 @@ if st.session_state.user_email and st.session_state.user_name:
 
     # Initialize tab list in session state
     if "tabs" not in st.session_state:
+        st.session_state.loaded_sort = st.session_state.get("job_sort", "Newest first")
         st.session_state.tabs = fetch_tabs_from_api()
         
     with st.sidebar:
@@ -54,12 +151,18 @@ if st.session_state.user_email and st.session_state.user_name:
         # Add Tab
         new_tab = st.text_input("➕ New Job", key="new_tab_input")
         if st.button("Add Job"):
-            if new_tab and new_tab not in st.session_state.tabs:
-                add_tab_to_api(new_tab)
+            if new_tab and new_tab not in st.session_state.tabs and add_tab_to_api(new_tab):
                 st.session_state.tabs = fetch_tabs_from_api()
                 st.success(f"Added Job: {new_tab}")
-            elif new_tab in st.session_state.tabs:
+            elif new_tab:
                 st.warning("Job already exists.")
+
+        # Jobs are listed a page at a time
+        if st.selectbox("↕️ Sort Jobs", list(JOB_SORTS), key="job_sort") != st.session_state.get("loaded_sort"):
+            st.session_state.loaded_sort = st.session_state.job_sort
+            st.session_state.tabs = fetch_tabs_from_api()
+        if st.session_state.get("jobs_cursor") and st.button("Load More Jobs"):
+            st.session_state.tabs += fetch_tabs_from_api(after=st.session_state.jobs_cursor)
         
         # Delete Tab
         if st.session_state.tabs:
@@ -87,6 +190,29 @@ if st.session_state.user_email and st.session_state.user_name:
                 st.session_state.tabs = fetch_tabs_from_api()
                 st.warning(f"Deleted Job: {tab_to_delete}")
 
+        # Tailor resumes for several jobs in one go
+        poll_batch = False
+        if st.session_state.tabs:
+            batch_jobs = st.multiselect("📄 Tailor Resumes for Jobs", st.session_state.tabs, key="batch_jobs")
+            if "tailor_task" in st.session_state:
+                progress = get_batch_progress()
+                if progress and not progress["isDone"]:
+                    st.progress(progress["done"] / max(progress["total"], 1),
+                                text=f"Tailored {progress['done']} of {progress['total']} resumes")
+                    poll_batch = True
+                elif progress:
+                    failed = [job["job_name"] for job in progress["jobs"] if job["status"] == "failed"]
+                    if failed:
+                        st.warning(f"Could not tailor: {', '.join(failed)}")
+            elif st.button("Generate Tailored Resumes") and batch_jobs:
+                response = requests.post(f"{API_BASE}/tailor-resumes", json={
+                    "unique_id": st.session_state.user_email,
+                    "job_ids": [st.session_state.job_ids[job] for job in batch_jobs]
+                })
+                if response.status_code == 202:
+                    st.session_state.tailor_task = response.json()["task_id"]
+                    st.rerun()
+
         st.divider()
         
         # Logout button
@@ -95,187 +221,175 @@ if st.session_state.user_email and st.session_state.user_name:
             st.session_state.user_name = ''
             st.rerun()
         
-    # --- Render tabs dynamically ---
+    # --- Render only the job being viewed ---
     if st.session_state.tabs:
-        tabs = st.tabs(st.session_state.tabs)
-        for i, tab in enumerate(tabs):
-            job_name = st.session_state.tabs[i]
-            job_url_key = f"url_{job_name}"
-            job_desc_key = f"desc_{job_name}"
-            job_req_key = f"req_{job_name}"
-
-            # Only fetch data once (on first render)
-            if job_url_key not in st.session_state or job_desc_key not in st.session_state:
-                job_url, job_desc, job_req = get_job_info_by_name(job_name)
+        job_name = st.selectbox("💼 Job", st.session_state.tabs, key="active_job")
+        bundle = fetch_job_bundle(job_name)
+        poll_questions = False
+        job_url_key = f"url_{job_name}"
+        job_desc_key = f"desc_{job_name}"
+        job_req_key = f"req_{job_name}"
+
+        # Only fetch data once (on first render)
+        if job_url_key not in st.session_state or job_desc_key not in st.session_state:
+            job_url, job_desc, job_req = get_job_info_by_name(bundle, job_name)
+            if job_url:
+                st.session_state[job_url_key] = job_url
+            if job_desc:
+                st.session_state[job_desc_key] = job_desc
+            if job_req:
+                st.session_state[job_req_key] = job_req
+
+        st.subheader(f"💼 {job_name}")
+        job_url = st.text_input("Job URL", key=job_url_key)
+        
+        # Show "Get Description" button if no description is present
+        if not st.session_state.get(job_desc_key, ""):
+            if st.button("🔍 Get Description", key=f"btn_fetch_{job_name}"):
                 if job_url:
-                    st.session_state[job_url_key] = job_url
-                if job_desc:
-                    st.session_state[job_desc_key] = job_desc
-                if job_req:
-                    st.session_state[job_req_key] = job_req
-
-            with tab:
-                st.subheader(f"💼 {job_name}")
-                job_url = st.text_input("Job URL", key=job_url_key)
+                    desc, req = fetch_description_by_url(job_name, job_url)
+                    if desc:
+                        st.session_state[job_desc_key] = desc
+                        st.session_state[job_req_key] = req
+                    st.rerun()
+                else:
+                    st.warning("Please enter a job URL.")
+        
+        col1, col2 = st.columns(2)
+        col1.text_area("Job Description", key=job_desc_key, height=300, disabled=True)
+        col1.text_area("Qualifications and Requirements", key=job_req_key, height=300, disabled=True )
+
+        if st.session_state[job_desc_key] and st.session_state[job_req_key]:
+            job_uuid = bundle.get(job_name, {}).get("job_id")
+            resume_path = tailored_resume_path(job_name, job_uuid)
+            letter_path = f"./cover-letter/cover-letter-{job_name}-{job_uuid}.pdf"
+            
+            if os.path.exists(resume_path):
+                with open(resume_path, "rb") as file:
+                    col1.download_button(
+                        label="📥 Download Tailored Resume PDF",
+                        data=file,
+                        file_name=os.path.basename(resume_path),
+                        mime="application/pdf"
+                    )
+            else:
+                if col1.button("Generate Tailored Resume for this Job", key=f"btn_resume_{job_name}"):
+                    response = cached_get("http://backend:8000/load-details",
+                                    params={"unique_id": st.session_state.user_email})
+                    response_json = dict(response.json())
+                    data = {}
+                    for k,v in response_json.items():
+                        data[k] = v
+                    response = requests.post("http://backend:8000/generate-tailored-resume",
+                                json={"data": data, "job_desc" : st.session_state[job_desc_key]}
+                    )
+                    if response.status_code == 200:
+                        file_name = '_'.join(st.session_state.user_name.split())
+                        with open(resume_path, "wb") as f:
+                            f.write(response.content)
+                        st.rerun()
+
+            if os.path.exists(letter_path):
+                with open(letter_path, "rb") as file:
+                    col1.download_button(
+                        label="📥 Download Cover Letter PDF",
+                        data=file,
+                        file_name=os.path.basename(letter_path),
+                        mime="application/pdf"
+                    )
+            else:
+                if col1.button("Generate Cover Letter for this Job", key=f"btn_cover_letter_{job_name}"):
+                    response = cached_get("http://backend:8000/load-details",
+                                    params={"unique_id": st.session_state.user_email})
+                    response_json = dict(response.json())
+                    data = {}
+                    for k,v in response_json.items():
+                        data[k] = v
+                    response = requests.post("http://backend:8000/generate-cover-letter",
+                                json={"resume": data ,"job_desc" : st.session_state[job_desc_key]}
+                    )
+                    if response.status_code == 200:
+                        file_name = '_'.join(st.session_state.user_name.split())
+                        with open(letter_path, "wb") as f:
+                            f.write(response.content)
+                        st.rerun()
+                
+            # Chatbot
+            with col2.container():
+                st.header("Ask our AI expert about your job fit.")
+                chat_key = f"messages_{job_name}"
+                history = st.container(height=650)
+                if "chat_input_count" not in st.session_state:
+                    st.session_state.chat_input_count = 0
+                if chat_key not in st.session_state:
+                    response = cached_get("http://backend:8000/load-details",
+                                        params={"unique_id": st.session_state.user_email})
+                    response_json = dict(response.json())
+                    data = {}
+                    for k,v in response_json.items():
+                        data[k] = v
+                    st.session_state[chat_key] = [
+                        {"role": "developer", "content": f"""You are a helpful career assistant who is given the information about a job, along with its requirements and qualifications. Evaluate a person's resume using its JSON and answer the questions asked by the person. Do not make up any new information. Do not ask any questions back. Always be straight to the points and your responses must be very brief.
+                                                        \nJob Description: {st.session_state[job_desc_key]}
+                                                        \nJob Requirements and Qualifications: {st.session_state[job_req_key]}
+                                                        \nPerson's Resume: {data}"""}
+                    ]
+                # Display chat messages
+                for msg in st.session_state[chat_key][1:]:  # Skip the system prompt
+                    with history.chat_message(msg["role"]):
+                        st.markdown(msg["content"])
                 
-                # Show "Get Description" button if no description is present
-                if not st.session_state.get(job_desc_key, ""):
-                    if st.button("🔍 Get Description", key=f"btn_fetch_{job_name}"):
-                        if job_url:
-                            desc, req = fetch_description_by_url(job_name, job_url)
-                            if desc:
-                                st.session_state[job_desc_key] = desc
-                                st.session_state[job_req_key] = req
-                            st.rerun()
-                        else:
-                            st.warning("Please enter a job URL.")
+                if prompt := st.chat_input("Ask our AI whether the job suits you...", key=f"{job_name}_chat_input"):
+                    st.session_state[chat_key].append({"role": "user", "content": prompt})
+                    with history.chat_message("user"):
+                        st.markdown(prompt)
+
+                    with history.chat_message("assistant"):
+                        stream = openai_client.chat.completions.create(
+                            model="gpt-4.1-nano-2025-04-14",
+                            messages=st.session_state[chat_key],
+                            stream=True
+                        )
+                        response = st.write_stream(stream)
+                    st.session_state[chat_key].append({"role": "assistant", "content": response})
                 
-                col1, col2 = st.columns(2)
-                col1.text_area("Job Description", key=job_desc_key, height=300, disabled=True)
-                col1.text_area("Qualifications and Requirements", key=job_req_key, height=300, disabled=True )
-
-                if st.session_state[job_desc_key] and st.session_state[job_req_key]:
-                    response = requests.get("http://backend:8000/get-job-uuid", json={"unique_id": st.session_state.user_email, "job_name": job_name})
-                    job_uuid = response.json().get("job_uuid")
-                    resume_path = f"./resume/resume-{job_name}-{job_uuid}.pdf"
-                    letter_path = f"./cover-letter/cover-letter-{job_name}-{job_uuid}.pdf"
-                    
-                    if os.path.exists(resume_path):
-                        with open(resume_path, "rb") as file:
-                            col1.download_button(
-                                label="📥 Download Tailored Resume PDF",
-                                data=file,
-                                file_name=os.path.basename(resume_path),
-                                mime="application/pdf"
-                            )
-                    else:
-                        if col1.button("Generate Tailored Resume for this Job", key=f"btn_resume_{job_name}"):
-                            response = requests.get("http://backend:8000/load-details",
-                                            params={"unique_id": st.session_state.user_email})
-                            response_json = dict(response.json())
-                            data = {}
-                            for k,v in response_json.items():
-                                data[k] = v
-                            response = requests.post("http://backend:8000/generate-tailored-resume",
-                                        json={"data": data, "job_desc" : st.session_state[job_desc_key]}
-                            )
-                            if response.status_code == 200:
-                                file_name = '_'.join(st.session_state.user_name.split())
-                                with open(resume_path, "wb") as f:
-                                    f.write(response.content)
-                                st.rerun()
-
-                    if os.path.exists(letter_path):
-                        with open(letter_path, "rb") as file:
-                            col1.download_button(
-                                label="📥 Download Cover Letter PDF",
-                                data=file,
-                                file_name=os.path.basename(letter_path),
-                                mime="application/pdf"
-                            )
-                    else:
-                        if col1.button("Generate Cover Letter for this Job", key=f"btn_cover_letter_{job_name}"):
-                            response = requests.get("http://backend:8000/load-details",
-                                            params={"unique_id": st.session_state.user_email})
-                            response_json = dict(response.json())
-                            data = {}
-                            for k,v in response_json.items():
-                                data[k] = v
-                            response = requests.post("http://backend:8000/generate-cover-letter",
-                                        json={"resume": data ,"job_desc" : st.session_state[job_desc_key]}
-                            )
-                            if response.status_code == 200:
-                                file_name = '_'.join(st.session_state.user_name.split())
-                                with open(letter_path, "wb") as f:
-                                    f.write(response.content)
-                                st.rerun()
-                        
-                    # Chatbot
-                    with col2.container():
-                        st.header("Ask our AI expert about your job fit.")
-                        chat_key = f"messages_{job_name}"
-                        history = st.container(height=650)
-                        if "chat_input_count" not in st.session_state:
-                            st.session_state.chat_input_count = 0
-                        if chat_key not in st.session_state:
-                            response = requests.get("http://backend:8000/load-details",
-                                                params={"unique_id": st.session_state.user_email})
-                            response_json = dict(response.json())
-                            data = {}
-                            for k,v in response_json.items():
-                                data[k] = v
-                            st.session_state[chat_key] = [
-                                {"role": "developer", "content": f"""You are a helpful career assistant who is given the information about a job, along with its requirements and qualifications. Evaluate a person's resume using its JSON and answer the questions asked by the person. Do not make up any new information. Do not ask any questions back. Always be straight to the points and your responses must be very brief.
-                                                                \nJob Description: {st.session_state[job_desc_key]}
-                                                                \nJob Requirements and Qualifications: {st.session_state[job_req_key]}
-                                                                \nPerson's Resume: {data}"""}
-                            ]
-                        # Display chat messages
-                        for msg in st.session_state[chat_key][1:]:  # Skip the system prompt
-                            with history.chat_message(msg["role"]):
-                                st.markdown(msg["content"])
-                        
-                        if prompt := st.chat_input("Ask our AI whether the job suits you...", key=f"{job_name}_chat_input"):
-                            st.session_state[chat_key].append({"role": "user", "content": prompt})
-                            with history.chat_message("user"):
-                                st.markdown(prompt)
-
-                            with history.chat_message("assistant"):
-                                stream = openai_client.chat.completions.create(
-                                    model="gpt-4.1-nano-2025-04-14",
-                                    messages=st.session_state[chat_key],
-                                    stream=True
-                                )
-                                response = st.write_stream(stream)
-                            st.session_state[chat_key].append({"role": "assistant", "content": response})
-                        
-                    st.divider()
-
-                    # Questions
-                    coll_1, coll_2 = st.columns(2)
-                    coll_1.subheader("Find Relevant Interview Questions for the Job")
-
-                    check_response = requests.get("http://backend:8000/get-questions", json={"unique_id": st.session_state.user_email, "job_name": job_name})
-                    if check_response.status_code == 200 and check_response.json().get("isFound"):
-                        response_json = check_response.json()
-                        
-                        with coll_1.expander("Technical Questions"):
-                            st.markdown(response_json["technical_questions"])
-                        with coll_1.expander("HR Questions"):
-                            st.markdown(response_json["hr_questions"])
-                        
-                        coll_2.subheader("DSA Questions")
-                        with coll_2.container():
-                            questions = response_json["leetcode_questions"]
-                            for q in questions:
-                                for title, url in q.items():
-                                    with st.expander(title):
-                                        st.markdown(url)
-                                        if st.button(f"🔍 Show Tips to solve this question", key=f"{job_name}_{title}_desc_button"):
-                                            with st.spinner("Trying to solve the problem..."):
-                                                lc_response = requests.get("http://backend:8000/get-leetcode-description",
-                                                                        json={"question": title, "url": url})
-                                                lc_response_json = lc_response.json()
-                                                st.markdown(lc_response_json['desc'])
-                    else:
-                        if coll_1.button("❓ Find Interview Questions", key=f"{job_name}_find_tech"):
-                            response_user = requests.get("http://backend:8000/load-details",
-                                                params={"unique_id": st.session_state.user_email})
-                            response_user_json = dict(response_user.json())
-                            data = {}
-                            for k,v in response_user_json.items():
-                                data[k] = v
-                            with st.spinner("Finding Questions... (This may take a minute)"):
-                                requests.post("http://backend:8000/find-questions",
-                                                        json={
-                                                            "job_name": job_name,
-                                                            "job_desc": st.session_state[job_desc_key],
-                                                            "job_req": st.session_state[job_req_key],
-                                                            "user_info": data,
-                                                            "unique_id": st.session_state.user_email
-                                                        })
-                            st.rerun()
-                    
+            st.divider()
+
+            # Questions
+            coll_1, coll_2 = st.columns(2)
+            coll_1.subheader("Find Relevant Interview Questions for the Job")
+
+            response_json, is_pending = get_questions_progress(bundle, job_name)
+            render_questions(coll_1, coll_2, job_name, response_json)
+            has_all_questions = all(response_json.get(k) for k in ["technical_questions", "hr_questions", "leetcode_questions"])
+
+            if is_pending:
+                coll_1.info("Finding Questions... Categories appear here as soon as they are ready.")
+                poll_questions = True
+            elif not has_all_questions:
+                if coll_1.button("❓ Find Interview Questions", key=f"{job_name}_find_tech"):
+                    response_user = cached_get("http://backend:8000/load-details",
+                                        params={"unique_id": st.session_state.user_email})
+                    response_user_json = dict(response_user.json())
+                    data = {}
+                    for k,v in response_user_json.items():
+                        data[k] = v
+                    response = requests.post("http://backend:8000/find-questions",
+                                            json={
+                                                "job_name": job_name,
+                                                "job_desc": st.session_state[job_desc_key],
+                                                "job_req": st.session_state[job_req_key],
+                                                "user_info": data,
+                                                "unique_id": st.session_state.user_email
+                                            })
+                    if response.status_code == 202:
+                        st.session_state[f"questions_task_{job_name}"] = response.json()["task_id"]
+                    st.rerun()
+
+        # Poll running find-questions and batch tailoring tasks once the page has been drawn.
+        if poll_questions or poll_batch:
+            time.sleep(2)
+            st.rerun()
 
     else:
         st.info("No Jobs available. Add one from the sidebar to get started.")